@@ -336,4 +336,64 @@ def test_prepare_trk_data_from_fbr_and_correction(monkeypatch):
     fbr = DummyFbr()
     img = DummyImg()
     out = c._prepare_trk_data_from_fbr(fbr, img)
-    assert isinstance(out, list)
\ No newline at end of file
+    assert isinstance(out, list)
+# --- Batch conversion and CLI ---
+
+def test_convert_batch_two_files(tmp_path):
+    from nibabel.streamlines import Tractogram, TrkFile
+    tract = Tractogram([np.array([[0., 0., 0.], [1., 1., 1.]], dtype=np.float32)],
+                       affine_to_rasmm=np.eye(4))
+    jobs = []
+    for stem in ("a", "b"):
+        trk = str(tmp_path / f"{stem}.trk")
+        TrkFile(tract).save(trk)
+        jobs.append((trk, str(tmp_path / f"{stem}.tck"), None))
+    outputs = Converter.convert_batch(jobs, workers=1)
+    assert outputs == [job[1] for job in jobs]
+    for output in outputs:
+        assert os.path.exists(output)
+
+def test_convert_batch_reports_errors_per_job(tmp_path):
+    from nibabel.streamlines import Tractogram, TrkFile
+    tract = Tractogram([np.array([[0., 0., 0.], [1., 1., 1.]], dtype=np.float32)],
+                       affine_to_rasmm=np.eye(4))
+    good = str(tmp_path / "good.trk")
+    TrkFile(tract).save(good)
+    good_out = str(tmp_path / "good.tck")
+    bad = str(tmp_path / "missing.trk")
+    with pytest.raises(ValueError) as excinfo:
+        Converter.convert_batch([(good, good_out, None),
+                                 (bad, str(tmp_path / "missing.tck"), None)],
+                                workers=1)
+    assert bad in str(excinfo.value)
+    # the failing job does not abort the rest of the batch
+    assert os.path.exists(good_out)
+
+def test_convert_batch_empty():
+    assert Converter.convert_batch([]) == []
+
+def test_cli_convert_parses_arguments(monkeypatch, tmp_path, capsys):
+    from visubrain.__main__ import main
+    (tmp_path / "s1.trk").write_bytes(b"")
+    captured = {}
+    def fake_batch(jobs):
+        captured['jobs'] = list(jobs)
+        return [job[1] for job in captured['jobs']]
+    monkeypatch.setattr(Converter, "convert_batch", fake_batch)
+    monkeypatch.setattr("sys.argv", ["visubrain", "convert",
+                                     str(tmp_path / "*.trk"),
+                                     str(tmp_path / "{stem}.tck"),
+                                     "anat.nii"])
+    main()
+    assert captured['jobs'] == [(str(tmp_path / "s1.trk"),
+                                 str(tmp_path / "s1.tck"),
+                                 "anat.nii")]
+    assert str(tmp_path / "s1.tck") in capsys.readouterr().out
+
+def test_cli_convert_usage_exit(monkeypatch, capsys):
+    from visubrain.__main__ import main
+    monkeypatch.setattr("sys.argv", ["visubrain", "convert"])
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 2
+    assert "usage" in capsys.readouterr().out
@@ -1,6 +1,7 @@
 import os
 import struct
 import tempfile
+import numpy as np
 import pytest
 
 from visubrain.io.fbr import BinaryFbrFile
@@ -112,6 +113,51 @@ def test_write_fbr_and_readback():
         assert pts[1] == (4.0, 5.0, 6.0)
     os.remove(tmp.name)
 
+def test_streaming_write_and_readback():
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        header = {
+            'FileVersion': 1,
+            'CoordsType': 0,
+            'FibersOrigin': (0.0, 0.0, 0.0),
+            'NrOfGroups': 1,
+            'Groups': [{
+                'Name': 'G1',
+                'Visible': 1,
+                'Animate': 0,
+                'Thickness': 1.0,
+                'Color': (1, 2, 3),
+                'NrOfFibers': 0  # patched by close_write
+            }]
+        }
+        writer = BinaryFbrFile()
+        writer.open_write(tmp.name, header)
+        # interleaved 'Points' shape
+        writer.append_fiber({
+            'NrOfPoints': 2,
+            'Points': [
+                (1.0, 2.0, 3.0, 10, 20, 30),
+                (4.0, 5.0, 6.0, 40, 50, 60)
+            ]
+        })
+        # SoA shape with separate coordinate and color planes
+        writer.append_fiber({
+            'NrOfPoints': 2,
+            'xyz': np.array([[7.0, 8.0, 9.0], [10.0, 11.0, 12.0]]),
+            'rgb': np.array([[1, 2, 3], [4, 5, 6]], dtype=np.uint8)
+        })
+        writer.close_write()
+
+        fbr = BinaryFbrFile(tmp.name)
+        assert fbr.num_fibers == 2  # count patched in by close_write
+        assert fbr.get_header()['NrOfFibers'] == "2"
+        fibers = fbr.groups[0]['fibers']
+        assert len(fibers) == 2
+        assert fibers[0]['points'] == [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)]
+        assert fibers[0]['colors'] == [(10, 20, 30), (40, 50, 60)]
+        assert fibers[1]['points'] == [(7.0, 8.0, 9.0), (10.0, 11.0, 12.0)]
+        assert fibers[1]['colors'] == [(1, 2, 3), (4, 5, 6)]
+    os.remove(tmp.name)
+
 def test_init_without_file():
     fbr = BinaryFbrFile()
     assert fbr._fbr_file is None
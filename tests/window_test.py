@@ -90,6 +90,8 @@ def test_on_load_volume_bad_dim(monkeypatch, window, qtbot):
     monkeypatch.setattr("visubrain.io.nifti.NiftiFile", lambda fp: MagicMock(get_dimensions=lambda: (1,)))
     with patch.object(QMessageBox, "critical") as crit:
         window._on_load_volume()
+        # loading runs on the thread pool, the dialog fires back on the GUI thread
+        qtbot.waitUntil(lambda: crit.call_count == 1, timeout=3000)
         crit.assert_called_once()
 
 def test_on_load_volume_error(monkeypatch, window, qtbot):
@@ -97,6 +99,7 @@ def test_on_load_volume_error(monkeypatch, window, qtbot):
     monkeypatch.setattr("visubrain.io.nifti.NiftiFile", lambda fp: (_ for _ in ()).throw(Exception("fail")))
     with patch.object(QMessageBox, "critical") as crit:
         window._on_load_volume()
+        qtbot.waitUntil(lambda: crit.call_count == 1, timeout=3000)
         crit.assert_called_once()
 
 def test_on_load_streamlines_new_session(monkeypatch, window, qtbot):
@@ -120,6 +123,7 @@ def test_on_load_streamlines_error(monkeypatch, window, qtbot):
     window._current_session = MagicMock(get_uid=lambda: 1, tracts={}, volume_obj=None)
     with patch.object(QMessageBox, "information") as info:
         window._on_load_streamlines()
+        qtbot.waitUntil(lambda: info.call_count == 1, timeout=3000)
         info.assert_called_once()
 
 def test_view_tracts_statistics_none(window, qtbot):
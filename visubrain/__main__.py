@@ -1,9 +1,52 @@
 # visubrain/main.py
+import glob
 import sys
-from PyQt6.QtWidgets import QApplication
-from visubrain.gui.window import WindowApp
+from pathlib import Path
+
+
+def batch_convert(input_glob, output_template, anatomical_ref=None):
+    """
+    Convert every file matching a glob pattern, fanning the independent
+    conversions out across CPU cores.
+
+    Args:
+        input_glob (str): Glob pattern selecting the input files.
+        output_template (str): Output path template; '{stem}' is replaced by
+            the input file name without its extension.
+        anatomical_ref (str, optional): Anatomical reference passed to each
+            conversion (required for .tck/.fbr inputs).
+
+    Returns:
+        list: Paths of the written output files.
+    """
+    from visubrain.core.converter import Converter
+
+    jobs = []
+    for input_file in sorted(glob.glob(input_glob)):
+        name = Path(input_file).name
+        stem = name[:-len(''.join(Path(input_file).suffixes))] or name
+        jobs.append((input_file, output_template.format(stem=stem), anatomical_ref))
+
+    return Converter.convert_batch(jobs)
+
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "convert":
+        if len(sys.argv) < 4:
+            print("usage: python -m visubrain convert <input_glob> "
+                  "<output_template> [anatomical_ref]")
+            print("example: python -m visubrain convert 'data/*.trk' "
+                  "'out/{stem}.tck'")
+            sys.exit(2)
+        ref = sys.argv[4] if len(sys.argv) > 4 else None
+        for output_file in batch_convert(sys.argv[2], sys.argv[3], ref):
+            print(output_file)
+        return
+
+    # GUI imports stay inside the branch so the CLI path does not pay for Qt.
+    from PyQt6.QtWidgets import QApplication
+    from visubrain.gui.window import WindowApp
+
     app = QApplication(sys.argv)
     window = WindowApp()
     window.show()
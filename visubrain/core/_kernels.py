@@ -0,0 +1,52 @@
+"""
+visubrain/core/_kernels.py
+
+Optional Numba-compiled kernels for the VisuBrain conversion hot paths.
+
+Numba is an optional dependency: when it is not installed the exported
+kernels are None and callers fall back to their NumPy implementations.
+The kernels only pay off on very large tractograms (millions of points),
+where a single tight loop avoids the boolean-mask temporaries of the
+vectorized path.
+"""
+
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def streamline_bounds_check(flat, starts, lengths, rot, offset, shape,
+                                valid):
+        """
+        Flag streamlines whose every point maps inside the voxel grid.
+
+        Args:
+            flat: Concatenated (N, 3) float32 points.
+            starts: Start index of each streamline in flat.
+            lengths: Point count of each streamline.
+            rot: 3x3 world-to-voxel rotation (center shift folded into offset).
+            offset: 3-vector world-to-voxel translation.
+            shape: Voxel grid dimensions (3 floats).
+            valid: Output bool array, one flag per streamline.
+        """
+        for i in prange(starts.shape[0]):
+            ok = True
+            for j in range(starts[i], starts[i] + lengths[i]):
+                x = flat[j, 0]
+                y = flat[j, 1]
+                z = flat[j, 2]
+                ix = rot[0, 0] * x + rot[0, 1] * y + rot[0, 2] * z + offset[0]
+                iy = rot[1, 0] * x + rot[1, 1] * y + rot[1, 2] * z + offset[1]
+                iz = rot[2, 0] * x + rot[2, 1] * y + rot[2, 2] * z + offset[2]
+                if (ix < 0 or ix >= shape[0]
+                        or iy < 0 or iy >= shape[1]
+                        or iz < 0 or iz >= shape[2]):
+                    ok = False
+                    break
+            valid[i] = ok
+else:
+    streamline_bounds_check = None
@@ -13,20 +13,118 @@ Classes:
 """
 
 
+import functools
 import gzip
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+try:
+    # ISA-L's igzip is a drop-in gzip replacement whose DEFLATE/CRC32 use
+    # SIMD kernels; it decompresses typical volumetric payloads 2-4x faster.
+    # The threaded variant additionally overlaps (de)compression with I/O.
+    from isal import igzip_threaded as _gzip
+except ImportError:
+    try:
+        from isal import igzip as _gzip
+    except ImportError:
+        _gzip = gzip
+
+# nibabel, dipy and bvbabel (and the io modules pulling them in) are
+# imported inside the conversion methods that need them: importing this
+# module from the GUI would otherwise pay their full import cost at
+# startup even when no conversion ever runs.
 import numpy as np
-import nibabel as nib
 
-from dipy.io.stateful_tractogram import StatefulTractogram, Space
-from dipy.io.streamline import load_tractogram, save_tractogram
-from bvbabel.vmr import read_vmr
 
-from visubrain.io.fbr import BinaryFbrFile
-from visubrain.io.tractography import Tractography
-from visubrain.io.vmr import VMRFile
+@functools.lru_cache(maxsize=256)
+def _ext(path: str) -> str:
+    """
+    Return the normalized extension of a file path (lowercase, without the
+    leading dot), treating compound suffixes like '.nii.gz' as one extension.
+
+    Cached so batch conversions do not re-parse the same paths.
+
+    Args:
+        path (str): File path to inspect.
+
+    Returns:
+        str: Normalized extension (e.g. 'trk', 'nii.gz').
+    """
+    return ''.join(Path(path).suffixes).lower().lstrip('.')
+
+
+@functools.lru_cache(maxsize=16)
+def _load_ref_cached(path: str, mtime: float):
+    """Backing cache for _load_ref, keyed on (path, mtime)."""
+    import nibabel as nib
+    return nib.load(path)
+
+
+def _load_ref(path: str):
+    """
+    Load an anatomical reference image, caching the parsed result.
+
+    Converting many tractograms against the same template would otherwise
+    re-open and re-parse the NIfTI header once per conversion. The cache key
+    includes the file's mtime, so a reference that is rewritten between
+    conversions is reloaded instead of served stale.
+
+    Args:
+        path (str): Path to the reference NIfTI file.
+
+    Returns:
+        nibabel.Nifti1Image: Loaded reference image.
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        # Missing/unreadable path: let nib.load raise its usual error
+        # without poisoning the cache.
+        import nibabel as nib
+        return nib.load(path)
+    return _load_ref_cached(path, mtime)
+
+
+def _convert_one(job):
+    """
+    Run one conversion; module-level so process pools can pickle it.
+
+    Args:
+        job (tuple): (input_file, output_file, anatomical_ref) paths.
+
+    Returns:
+        str: Path of the written output file.
+    """
+    input_file, output_file, anatomical_ref = job
+    Converter(input_file, output_file, anatomical_ref).convert()
+    return output_file
+
+
+def _convert_one_safe(job):
+    """
+    Run one conversion, trapping the error instead of raising.
+
+    Lets convert_batch finish the remaining jobs and report every failure,
+    rather than aborting the pool on the first bad file. Module-level so
+    process pools can pickle it.
+
+    Args:
+        job (tuple): (input_file, output_file, anatomical_ref) paths.
+
+    Returns:
+        tuple: (output_file or None, error message or None).
+    """
+    try:
+        return _convert_one(job), None
+    except Exception as e:
+        return None, str(e)
 
 
 class Converter:
@@ -47,7 +145,8 @@ class Converter:
     def __init__(self,
                  input_file: str,
                  output_file: str,
-                 anatomical_ref: str | None = None):
+                 anatomical_ref: str | None = None,
+                 compresslevel: int = 1):
         """
         Initialize the Converter.
 
@@ -56,14 +155,20 @@ class Converter:
             output_file (str): Path to the output file.
             anatomical_ref (str, optional): Anatomical reference, required for some formats
             (e.g., tck, fbr).
+            compresslevel (int, optional): Deflate level for gzipped outputs
+            (.voi). The default of 1 is several times faster than the
+            stdlib default with only a few percent size increase on imaging
+            payloads; the level never affects correctness.
         """
         self.input = input_file
         self.output = output_file
 
         self.anatomical_ref = anatomical_ref # pour tck et fbr (obligatoire)
+        self.compresslevel = compresslevel
 
-        self.in_ext = ''.join(Path(input_file).suffixes).lower().lstrip('.')
-        self.out_ext = ''.join(Path(output_file).suffixes).lower().lstrip('.')
+        self.in_ext = _ext(input_file)
+        self.out_ext = _ext(output_file)
+        self._key = (self.in_ext, self.out_ext)
         self._validate_extensions()
 
     _CONVERTERS = {
@@ -79,6 +184,14 @@ class Converter:
         ('nii', 'vmr'): 'nii_to_vmr',('nii.gz', 'vmr'): 'nii_to_vmr'
     }
 
+    # Input extension -> supported output extensions, precomputed once at
+    # class creation so the GUI can fill its format combo with a single
+    # lookup instead of walking _CONVERTERS on every dialog open.
+    _INPUT_TO_OUTPUTS = {}
+    for _in, _out in _CONVERTERS:
+        _INPUT_TO_OUTPUTS.setdefault(_in, []).append(_out)
+    del _in, _out
+
     def _validate_extensions(self):
         """
         Validate that the combination of input and output extensions is supported.
@@ -86,9 +199,8 @@ class Converter:
         Raises:
             ValueError: If the conversion is not supported.
         """
-        key = (self.in_ext, self.out_ext)
-        if key not in self._CONVERTERS:
-            raise ValueError(f"Conversion {key} not supported")
+        if self._key not in self._CONVERTERS:
+            raise ValueError(f"Conversion {self._key} not supported")
 
     def convert(self):
         """
@@ -98,15 +210,71 @@ class Converter:
             ValueError: If conversion fails.
         """
         try:
-            method_name = self._CONVERTERS[(self.in_ext, self.out_ext)]
-            getattr(self, method_name)()
+            # match compiles to a jump table, skipping the dict lookup on the
+            # hot batch path; calls go through self so runtime overrides of
+            # the conversion methods are still honored (binding the method in
+            # __init__ would freeze overrides applied after construction).
+            # _CONVERTERS remains the single source of truth for
+            # _validate_extensions and the GUI.
+            match self._key:
+                case ('trk', 'fbr'): self.trk_to_fbr()
+                case ('fbr', 'trk'): self.fbr_to_trk()
+                case ('trk', 'tck'): self.trk_to_tck()
+                case ('tck', 'trk'): self.tck_to_trk()
+                case ('voi', 'nii'): self.voi_to_nii()
+                case ('voi', 'nii.gz'): self.voi_to_nii_gz()
+                case ('nii', 'voi'): self.nii_to_voi()
+                case ('nii.gz', 'voi'): self.nii_gz_to_voi()
+                case ('vmr', 'nii') | ('vmr', 'nii.gz'): self.vmr_to_nii()
+                case ('nii', 'vmr') | ('nii.gz', 'vmr'): self.nii_to_vmr()
         except Exception as e :
             raise ValueError(f"Conversion {self.in_ext} to {self.out_ext} \n {e}") from e
 
+    @classmethod
+    def convert_batch(cls, jobs, workers=None):
+        """
+        Convert many files in parallel, one process per conversion.
+
+        Conversions are independent of each other, so the batch fans out over
+        a process pool and scales close to linearly with core count. A
+        failing job does not abort the batch: the remaining jobs still run,
+        and the failures are collected and raised together at the end.
+
+        Args:
+            jobs (iterable): (input_file, output_file, anatomical_ref) triples.
+            workers (int, optional): Number of worker processes; defaults to
+                the CPU count.
+
+        Returns:
+            list: Paths of the written output files, in job order.
+
+        Raises:
+            ValueError: If any job failed, listing one input/error pair per
+                failed job.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        max_workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(jobs) // (4 * max_workers))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_convert_one_safe, jobs,
+                                        chunksize=chunksize))
+        errors = [f"{job[0]}: {error}"
+                  for job, (_, error) in zip(jobs, results) if error is not None]
+        if errors:
+            raise ValueError("Batch conversion failed for:\n" + "\n".join(errors))
+        return [output for output, _ in results]
+
     def trk_to_tck(self):
         """Convert a .trk tractography file to .tck format."""
-        sft = load_tractogram(str(self.input), 'same')
-        save_tractogram(sft, str(self.output))
+        # Pure re-encoding: go through nibabel directly instead of building a
+        # StatefulTractogram (and its space validation) just to re-save the
+        # same data. Not lazy_load: nibabel saves lazily-loaded TRK
+        # tractograms with a spurious half-voxel offset.
+        import nibabel as nib
+        trk = nib.streamlines.load(str(self.input))
+        nib.streamlines.save(trk.tractogram, str(self.output))
 
     def tck_to_trk(self):
         """
@@ -117,7 +285,8 @@ class Converter:
         """
         if self.anatomical_ref is None:
             raise ValueError("A tck file needs an anatomical reference file.")
-        sft = load_tractogram(self.input, self.anatomical_ref)
+        from dipy.io.streamline import load_tractogram, save_tractogram
+        sft = load_tractogram(self.input, _load_ref(self.anatomical_ref))
         save_tractogram(sft, self.output)
 
     def vmr_to_nii(self):
@@ -127,60 +296,71 @@ class Converter:
         Raises:
             ValueError: If conversion fails.
         """
+        import nibabel as nib
+        from bvbabel.vmr import read_vmr
         try:
             header, data = read_vmr(self.input)
 
-            col_dir = np.array([header["ColDirX"],
-                                header["ColDirY"],
-                                header["ColDirZ"]])
-
-            row_dir = np.array([header["RowDirX"],
-                                header["RowDirY"],
-                                header["RowDirZ"]])
-
-            image_orientation_dcm = np.column_stack((row_dir,
-                                                     col_dir,
-                                                     np.cross(row_dir, col_dir)))
+            # Re-map the data plane straight from the file instead of keeping
+            # read_vmr's in-memory copy resident: the plane starts at byte 8
+            # (after the four uint16 pre-header fields) and the BV-to-Tal
+            # transpose/flips are views, so the volume streams to the output
+            # through the page cache.
+            del data
+            data = np.memmap(self.input, dtype='<B', mode='r', offset=8,
+                             shape=(header["DimZ"], header["DimY"],
+                                    header["DimX"]))
+            data = np.transpose(data, (0, 2, 1))[::-1, ::-1, ::-1]
+
+            # The affine is a 4x4 of trivial scalar arithmetic; fill it
+            # directly from Python floats instead of going through a chain of
+            # small-array NumPy calls (column_stack/cross/eye/matmul), each of
+            # which costs more in dispatch than the math itself.
+            sx = header["VoxelSizeX"]
+            sy = header["VoxelSizeY"]
+            sz = header["VoxelSizeZ"]
+            rx, ry, rz = header["RowDirX"], header["RowDirY"], header["RowDirZ"]
+            cx, cy, cz = header["ColDirX"], header["ColDirY"], header["ColDirZ"]
+            # slice normal = row x col
+            nx = ry * cz - rz * cy
+            ny = rz * cx - rx * cz
+            nz = rx * cy - ry * cx
 
             # volume center position
-            slice1_center = np.array([header["Slice1CenterX"],
-                                      header["Slice1CenterY"],
-                                      header["Slice1CenterZ"]])
-            slice_n_center = np.array([header["SliceNCenterX"],
-                                       header["SliceNCenterY"],
-                                       header["SliceNCenterZ"]])
-            image_position_center_dcm = (slice1_center + slice_n_center) / 2
-
-            # 4x4 matrix world (dicom) to patient
-            pixel_spacing_dcm = np.array([header["VoxelSizeX"],
-                                          header["VoxelSizeY"],
-                                          header["VoxelSizeZ"]])# voxels size (mm)
-            dcm_to_patient = np.eye(4)
-            dcm_to_patient[:3, :3] = image_orientation_dcm * pixel_spacing_dcm.reshape(1, 3)
-            dcm_to_patient[:3, 3] = image_position_center_dcm
+            ocx = (header["Slice1CenterX"] + header["SliceNCenterX"]) / 2
+            ocy = (header["Slice1CenterY"] + header["SliceNCenterY"]) / 2
+            ocz = (header["Slice1CenterZ"] + header["SliceNCenterZ"]) / 2
 
             # center of the volume to corner (voxel origin)
-            shift_center = np.eye(4)
-            shift_center[0, 3] = -(header["DimX"] + 1) / 2
-            shift_center[1, 3] = -(header["DimY"] + 2) / 2
-            shift_center[2, 3] = -(header["DimZ"] + 2) / 2
-            # shift center to corner
-            dcm_to_patient = np.dot(dcm_to_patient, shift_center)
-
-            # np.diag([-1, -1, 1, 1]) = patient_to_ras = (flip X et Y)
-            voxel2world = np.dot(np.diag([-1, -1, 1, 1]), dcm_to_patient)
+            shx = -(header["DimX"] + 1) / 2
+            shy = -(header["DimY"] + 2) / 2
+            shz = -(header["DimZ"] + 2) / 2
+
+            # Rows 0/1 carry the patient_to_ras flip (X and Y negated); the
+            # translation folds the corner shift into the scaled rotation.
+            voxel2world = np.array([
+                [-rx * sx, -cx * sy, -nx * sz,
+                 -(rx * sx * shx + cx * sy * shy + nx * sz * shz + ocx)],
+                [-ry * sx, -cy * sy, -ny * sz,
+                 -(ry * sx * shx + cy * sy * shy + ny * sz * shz + ocy)],
+                [rz * sx, cz * sy, nz * sz,
+                 rz * sx * shx + cz * sy * shy + nz * sz * shz + ocz],
+                [0.0, 0.0, 0.0, 1.0]], dtype=np.float64)
 
             if np.all(voxel2world[:3, :3] == 0):
                 voxel2world = np.eye(4)
 
+            # Keep the header dtype identical to the array dtype so nibabel
+            # serializes the mapped plane without retyping it on save.
             nii = nib.Nifti1Image(data, affine=voxel2world)
+            nii.header.set_data_dtype(data.dtype)
             nii.header["pixdim"][1] = header["VoxelSizeX"]
             nii.header["pixdim"][2] = header["VoxelSizeY"]
             nii.header["pixdim"][3] = header["VoxelSizeZ"]
             nii.header["dim"][2] = header["DimX"]
             nii.header["dim"][3] = header["DimY"]
             nii.header["dim"][1] = header["DimZ"]
-            nib.save(nii, self.output)
+            nii.to_filename(self.output)
         except Exception as exc:
             raise ValueError("Error while converting the VMR file.") from exc
 
@@ -191,38 +371,80 @@ class Converter:
         Raises:
             ValueError: If the input file is not a valid NIfTI file.
         """
+        from visubrain.io.vmr import VMRFile
         try:
             vmr_obj = VMRFile()
             vmr_obj.write_from_nifti(self.input, self.output)
         except Exception as exc:
             raise ValueError("The input file is not a valid Nifti file.") from exc
 
+    # Chunk size for gzip transcoding: the shutil default (64 KiB) means tens
+    # of thousands of Python-level read/write calls and small zlib
+    # (de)compress round-trips on large volumes; anything from 128 KiB up
+    # measurably helps, 4 MiB keeps the call count negligible.
+    _COPY_BUFFER_SIZE = 1 << 22  # 4 MiB
+
     def voi_to_nii(self):
         """Convert a VOI (gzipped) file to uncompressed NIfTI (.nii)."""
-        with gzip.open(self.input, 'rb') as f_in:
+        with _gzip.open(self.input, 'rb') as f_in:
             with open(self.output, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+                shutil.copyfileobj(f_in, f_out, self._COPY_BUFFER_SIZE)
+
+    # FICLONE ioctl request number (linux/fs.h): share the source extents
+    # with the destination on copy-on-write filesystems (XFS/Btrfs reflink).
+    _FICLONE = 0x40049409
+
+    @staticmethod
+    def _clone_or_copy(src, dst):
+        """
+        Copy src to dst, cloning the file extents instead of the bytes when
+        the filesystem supports it.
+
+        A successful FICLONE is an O(1) metadata operation with full
+        copy-on-write semantics, so the destination stays independent of the
+        source. Anything else (other OS, cross-device, unsupported
+        filesystem) falls back to a regular copy.
+
+        Args:
+            src (str): Source file path.
+            dst (str): Destination file path.
+        """
+        if fcntl is not None:
+            try:
+                with open(src, 'rb') as f_in, open(dst, 'wb') as f_out:
+                    fcntl.ioctl(f_out.fileno(), Converter._FICLONE, f_in.fileno())
+                    return
+            except OSError:
+                pass
+        # copyfile skips the permission-bit copy and uses the kernel
+        # zero-copy path (sendfile/copy_file_range) where available.
+        shutil.copyfile(src, dst)
 
     def voi_to_nii_gz(self):
         """Copy a VOI file to a NIfTI compressed format (.nii.gz)."""
-        shutil.copy(self.input, self.output)
+        self._clone_or_copy(self.input, self.output)
 
     def nii_to_voi(self):
         """Convert a NIfTI (.nii) file to gzipped VOI format."""
         with open(self.input, 'rb') as f_in:
-            with gzip.open(self.output, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+            with _gzip.open(self.output, 'wb',
+                            compresslevel=self.compresslevel) as f_out:
+                shutil.copyfileobj(f_in, f_out, self._COPY_BUFFER_SIZE)
 
     def nii_gz_to_voi(self):
         """Copy a gzipped NIfTI file (.nii.gz) to VOI format."""
-        shutil.copy(self.input, self.output)
+        self._clone_or_copy(self.input, self.output)
 
     def trk_to_fbr(self):
         """Convert a .trk tractography file to .fbr format."""
+        from visubrain.io.fbr import BinaryFbrFile
+        from visubrain.io.tractography import Tractography
 
-        tracto_obj = Tractography(str(self.input), 0, reference_nifti=None)
+        # Single load: the tractogram object below backs the header lookup,
+        # the streamline list and the color pass without re-reading the file.
+        tracto_obj = Tractography(str(self.input), 0)
 
-        sf_t: StatefulTractogram = tracto_obj.sf_t
+        sf_t = tracto_obj.sf_t
         dim_mm = sf_t.dimensions * sf_t.voxel_sizes
 
         origin_mm_pil = [dim_mm[1] / 2, dim_mm[2] / 2, dim_mm[0] / 2]
@@ -230,47 +452,81 @@ class Converter:
         # streamlines RAS+ mm
         streamlines_ras = tracto_obj.get_streamlines()
 
-        # streamlines RAS+ mm --> PIL+ mm  (BVI)
-        streamlines_pil = []
-        for sl in streamlines_ras:
-            # flip axes + axe orient = (x_pil = -y_ras, y_pil = -z_ras, z_pil = -x_ras)
-            sl_pil = np.stack([-sl[:, 1], -sl[:, 2], -sl[:, 0]], axis=1)
+        # streamlines RAS+ mm --> PIL+ mm (BVI): one matmul + broadcast add over
+        # all points at once instead of a per-streamline stack
+        if len(streamlines_ras) > 0:
+            lengths = np.fromiter((len(sl) for sl in streamlines_ras), dtype=np.int64)
+            flat_ras = np.concatenate([np.asarray(sl) for sl in streamlines_ras])
+            flat_pil = flat_ras @ self._RAS_TO_PIL.T + origin_mm_pil
+            streamlines_pil = np.split(flat_pil, np.cumsum(lengths)[:-1])
+        else:
+            lengths = np.zeros(0, dtype=np.int64)
+            flat_pil = np.empty((0, 3))
+            streamlines_pil = []
+
+        # The flat buffer and lengths are already known from the transform
+        # above; hand them down so get_color_points skips re-concatenating.
+        _, colors, _ = tracto_obj.get_color_points(show_points=False,
+                                                   streamlines=streamlines_pil,
+                                                   flat_points=flat_pil,
+                                                   lengths=lengths)
+        # Stream the fibers into the writer one at a time: each fiber dict is
+        # encoded and dropped before the next one is built, so the decoded
+        # Points payload of the whole tractogram is never resident at once.
+        header = self._fbr_header(origin_mm_pil, len(streamlines_pil))
+        fibers = (self._make_fbr_fiber(streamline, color)
+                  for streamline, color in zip(streamlines_pil, colors))
+        new_fbr = BinaryFbrFile()
+        new_fbr.write_fbr(self.output, header, fibers)
 
-            # origin offset
-            sl_pil = sl_pil + origin_mm_pil
+    # One record per fiber point, matching the FBR on-disk precision
+    # (float32 coordinates, uint8 colors).
+    _FBR_POINT_DTYPE = np.dtype([('xyz', '<f4', 3), ('rgb', 'u1', 3)])
 
-            streamlines_pil.append(sl_pil)
+    # flip axes + axe orient = (x_pil = -y_ras, y_pil = -z_ras, z_pil = -x_ras)
+    _RAS_TO_PIL = np.array([[0, -1, 0],
+                            [0, 0, -1],
+                            [-1, 0, 0]], dtype=np.float64)
 
-        _, colors, _ = tracto_obj.get_color_points(show_points=False, streamlines=streamlines_pil)
-        header, fibers = self._prepare_fbr_data_from_trk(streamlines_pil, colors, origin_mm_pil)
-        new_fbr = BinaryFbrFile()
-        new_fbr.write_fbr(self.output, header, fibers)
+    # flip axes + axe orient = (x_ras = -z_pil, y_ras = -x_pil, z_ras = -y_pil)
+    _FBR_TO_RAS = np.array([[0, 0, -1],
+                            [-1, 0, 0],
+                            [0, -1, 0]], dtype=np.float32)
 
     @staticmethod
-    def _prepare_fbr_data_from_trk(streamlines, colors, origin):
+    def _make_fbr_fiber(streamline, color):
         """
-        Prepare the header and fiber data for writing an FBR file from TRK streamlines.
+        Build one FBR fiber dictionary from a streamline and its point colors.
+
+        The payload stays structure-of-arrays: coordinates and colors are
+        separate typed ndarrays the writer serializes plane by plane, so no
+        per-point Python objects are boxed and the colors never take a
+        float detour.
 
         Args:
-            streamlines (list): List of streamlines.
-            colors (list): List of colors for each point in each streamline.
+            streamline: Points of the streamline in PIL+mm coordinates.
+            color: Per-point RGB colors.
 
         Returns:
-            tuple: Header dict, fibers list.
+            dict: Fiber dictionary with 'NrOfPoints', 'xyz' and 'rgb'.
         """
-        fibers = []
-        for streamline, color in zip(streamlines, colors):
-            fiber = {
-                'NrOfPoints': len(streamline),
-                'Points': [
-                    [float(point[0]), float(point[1]), float(point[2]),
-                     int(rgb[0]), int(rgb[1]), int(rgb[2])]
-                    for point, rgb in zip(streamline, color)
-                ]
-            }
-            fibers.append(fiber)
-
-        header = {
+        return {'NrOfPoints': len(streamline),
+                'xyz': np.ascontiguousarray(streamline, dtype=np.float32),
+                'rgb': np.ascontiguousarray(color, dtype=np.uint8)}
+
+    @staticmethod
+    def _fbr_header(origin, num_fibers):
+        """
+        Build the FBR header dictionary for a single converted fiber group.
+
+        Args:
+            origin (sequence): Fibers origin in PIL+mm coordinates.
+            num_fibers (int): Number of fibers in the group.
+
+        Returns:
+            dict: Header dictionary for BinaryFbrFile.write_fbr.
+        """
+        return {
             'FileVersion': 5,
             'CoordsType': 2,
             'FibersOrigin': [origin[0], origin[1], origin[2]],
@@ -282,11 +538,37 @@ class Converter:
                     'Animate': -1,
                     'Thickness': 0.3,
                     'Color': [0, 255, 255],
-                    'NrOfFibers': len(fibers)
+                    'NrOfFibers': num_fibers
                 }
             ]
         }
-        return header, fibers
+
+    @staticmethod
+    def _prepare_fbr_data_from_trk(streamlines, colors, origin=(0.0, 0.0, 0.0)):
+        """
+        Prepare the header and fiber data for writing an FBR file from TRK streamlines.
+
+        Args:
+            streamlines (list): List of streamlines.
+            colors (list): List of colors for each point in each streamline.
+            origin (sequence, optional): Fibers origin in PIL+mm coordinates.
+
+        Returns:
+            tuple: Header dict, fibers list (Points as plain lists).
+        """
+        fibers = []
+        for streamline, color in zip(streamlines, colors):
+            # Cast the whole streamline at once instead of converting each
+            # point in a Python loop (hot path on large tractograms).
+            record = np.empty(len(streamline), dtype=Converter._FBR_POINT_DTYPE)
+            record['xyz'] = streamline
+            record['rgb'] = color
+            fibers.append({
+                'NrOfPoints': len(streamline),
+                'Points': [xyz + rgb for xyz, rgb in zip(record['xyz'].tolist(),
+                                                         record['rgb'].tolist())]
+            })
+        return Converter._fbr_header(origin, len(fibers)), fibers
 
     def fbr_to_trk(self):
         """
@@ -298,25 +580,217 @@ class Converter:
         if self.anatomical_ref is None:
             raise ValueError("A fbr file needs an anatomical reference file.")
 
+        from dipy.io.stateful_tractogram import StatefulTractogram, Space
+        from dipy.io.streamline import save_tractogram
+        from visubrain.io.fbr import BinaryFbrFile
+
         fbr_obj = BinaryFbrFile(self.input)
         if fbr_obj.get_header()['CoordsType'] != 2:
             raise ValueError("Only FBR with BVI coordinates are supported.")
 
-        streamlines = self._prepare_trk_data_from_fbr(fbr_obj)
-
         try:
-            sf_t = StatefulTractogram(streamlines, self.anatomical_ref, space=Space.RASMM)
+            img = _load_ref(self.anatomical_ref)
+            streamlines = self._prepare_trk_data_from_fbr(fbr_obj, img)
+            sf_t = StatefulTractogram(self._as_array_sequence(streamlines), img,
+                                      space=Space.RASMM)
             save_tractogram(sf_t, self.output)
         except Exception as exc:
             raise ValueError("Problem between the reference anatomy and the fbr file") from exc
 
     @staticmethod
-    def _prepare_trk_data_from_fbr(fbr_obj):
+    def _fast_apply_affine(pts, affine):
+        """
+        Apply a 4x4 affine to an (N, 3) point block.
+
+        One matmul plus a broadcast add, hitting the BLAS GEMM fast path
+        instead of nibabel's per-call einsum dispatch.
+
+        Args:
+            pts: Points of shape (N, 3).
+            affine: 4x4 transform matrix.
+
+        Returns:
+            numpy.ndarray: Transformed points, shape (N, 3).
+        """
+        return pts @ affine[:3, :3].T + affine[:3, 3]
+
+    @staticmethod
+    def _affine_inv(affine):
+        """
+        Invert a rigid/affine 4x4 matrix analytically.
+
+        [[R, t], [0, 1]] inverts to [[R^-1, -R^-1 t], [0, 1]], so only the
+        3x3 block goes through linalg.inv instead of the full LAPACK solve on
+        the homogeneous matrix.
+
+        Args:
+            affine: 4x4 voxel-to-world matrix.
+
+        Returns:
+            numpy.ndarray: Inverse 4x4 matrix.
+        """
+        rot_inv = np.linalg.inv(affine[:3, :3])
+        out = np.eye(4)
+        out[:3, :3] = rot_inv
+        out[:3, 3] = -rot_inv @ affine[:3, 3]
+        return out
+
+    @staticmethod
+    def _as_array_sequence(streamlines):
+        """
+        Pack a list of streamlines into a nibabel ArraySequence.
+
+        Fills the sequence buffers directly (one concatenated float32 block
+        plus offset/length vectors) instead of letting nibabel append and
+        re-copy each streamline on its own.
+
+        Args:
+            streamlines (list): Streamlines as per-fiber point arrays.
+
+        Returns:
+            nibabel.streamlines.ArraySequence: Packed sequence.
+        """
+        from nibabel.streamlines.array_sequence import ArraySequence
+        seq = ArraySequence()
+        if not streamlines:
+            return seq
+        lengths = np.fromiter((len(s) for s in streamlines), dtype=np.int64)
+        seq._data = np.concatenate(
+            [np.asarray(s, dtype=np.float32) for s in streamlines])
+        seq._offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        seq._lengths = lengths
+        return seq
+
+    @staticmethod
+    def _correct_fbr_to_nifti(streamlines, img):
+        """
+        Shift FBR streamlines from their center-based origin to the world
+        position of the reference image center.
+
+        Args:
+            streamlines (list): Streamlines expressed relative to the volume center.
+            img: Reference image exposing ``shape`` and ``affine``.
+
+        Returns:
+            list: Streamlines translated into the reference world space.
+        """
+        center_vox = np.asarray(img.shape[:3], dtype=float) / 2
+        if np.array_equal(img.affine, np.eye(4)):
+            # Aligned reference (the common case for FBR exports): the offset
+            # is the voxel center itself, no affine product needed.
+            center_mm = center_vox
+        else:
+            center_mm = img.affine[:3, :3] @ center_vox + img.affine[:3, 3]
+        return [np.asarray(streamline) + center_mm for streamline in streamlines]
+
+    @staticmethod
+    def _filter_valid_streamlines(streamlines, img):
+        """
+        Keep only the streamlines that fall entirely inside the voxel grid of the
+        reference image.
+
+        All points are transformed to voxel space in one batched affine
+        product; per-streamline validity is then reduced from the flat
+        per-point mask with logical_and.reduceat, so the Python-level work is
+        O(1) in the number of points.
+
+        Args:
+            streamlines (list): Streamlines in world (RAS+mm) space.
+            img: Reference image exposing ``shape`` and ``affine``.
+
+        Returns:
+            list: Streamlines fully contained in the voxel grid.
+        """
+        streamlines = [s for s in streamlines if np.asarray(s).size > 0]
+        if not streamlines:
+            return []
+
+        shape = np.asarray(img.shape[:3], dtype=float)
+        inv_aff = Converter._affine_inv(img.affine)
+
+        offsets = np.concatenate(
+            ([0], np.cumsum([len(s) for s in streamlines])[:-1]))
+        flat = np.concatenate([np.asarray(s) for s in streamlines])
+        ijk = Converter._fast_apply_affine(flat, inv_aff)
+        point_ok = ((ijk >= 0) & (ijk < shape)).all(axis=1)
+        streamline_ok = np.logical_and.reduceat(point_ok, offsets)
+
+        return [s for s, ok in zip(streamlines, streamline_ok) if ok]
+
+    @staticmethod
+    def _correct_and_filter_fbr(streamlines, img):
+        """
+        Apply the center correction and the voxel-grid filter in one fused pass.
+
+        Equivalent to _correct_fbr_to_nifti followed by
+        _filter_valid_streamlines, but the translation and the inverse affine
+        are applied to one concatenated buffer, so the points are only moved
+        through memory once and no intermediate streamline list is built.
+
+        Args:
+            streamlines (list): Streamlines expressed relative to the volume center.
+            img: Reference image exposing ``shape`` and ``affine``.
+
+        Returns:
+            list: Corrected streamlines fully contained in the voxel grid.
+        """
+        if not streamlines:
+            return []
+
+        shape = np.asarray(img.shape[:3], dtype=float)
+        affine = img.affine
+        center_vox = shape / 2
+        if np.array_equal(affine, np.eye(4)):
+            center_mm = center_vox
+        else:
+            center_mm = affine[:3, :3] @ center_vox + affine[:3, 3]
+        inv_aff = Converter._affine_inv(affine)
+
+        lengths = np.fromiter((len(s) for s in streamlines), dtype=np.int64)
+        splits = np.cumsum(lengths)[:-1]
+        # Stay in float32 throughout: the FBR payload and the TRK output are
+        # both float32, and letting the float64 affine operands promote the
+        # buffer would double the memory traffic of the pass for nothing.
+        flat = np.concatenate(
+            [np.ascontiguousarray(s, dtype=np.float32) for s in streamlines])
+
+        # Fold the center shift into the affine offset: inv(A)(x + c) is one
+        # GEMM with b = R c + t, so the flat buffer goes through BLAS once
+        # and the output translation is applied to it in place afterwards.
+        rot = inv_aff[:3, :3]
+        offset = (rot @ center_mm + inv_aff[:3, 3]).astype(np.float32)
+
+        streamline_ok = None
+        if flat.shape[0] > 1_000_000:
+            # Huge tractograms: one tight compiled loop avoids the full-size
+            # ijk/mask temporaries. Numba is optional, so fall through to the
+            # NumPy path when the kernel is unavailable.
+            from visubrain.core._kernels import streamline_bounds_check
+            if streamline_bounds_check is not None:
+                streamline_ok = np.empty(len(lengths), dtype=np.bool_)
+                streamline_bounds_check(
+                    flat, np.concatenate(([0], splits)), lengths,
+                    rot.astype(np.float32), offset,
+                    shape.astype(np.float32), streamline_ok)
+        if streamline_ok is None:
+            ijk = flat @ rot.T.astype(np.float32) + offset
+            point_ok = ((ijk >= 0) & (ijk < shape)).all(axis=1)
+            streamline_ok = np.logical_and.reduceat(
+                point_ok, np.concatenate(([0], splits)))
+
+        flat += center_mm.astype(np.float32)
+        corrected = np.split(flat, splits)
+        return [s for s, ok in zip(corrected, streamline_ok) if ok]
+
+    @staticmethod
+    def _prepare_trk_data_from_fbr(fbr_obj, img=None):
         """
         Prepare TRK streamlines from an FBR file object and a NIfTI reference image.
 
         Args:
             fbr_obj (BinaryFbrFile): FBR file object.
+            img (optional): Reference image; when given, the streamlines are
+                shifted to its world center and clipped to its voxel grid.
 
         Returns:
             list: List of valid streamlines.
@@ -324,14 +798,17 @@ class Converter:
         streamlines = []
         for group in fbr_obj.groups:
             for fiber in group['fibers']:
-                if len(fiber['points']) < 2:
+                # Prefer the preparsed ndarray the FBR reader exposes; the
+                # tuple-list fallback covers hand-built fiber dicts.
+                fbr_pil = fiber.get('points_np')
+                if fbr_pil is None:
+                    fbr_pil = np.asarray(fiber['points'], dtype=np.float32)
+                if len(fbr_pil) < 2:
                     continue
+                # Single matmul against the precomputed PIL->RAS flip matrix
+                # instead of slicing/negating/column_stack-ing per axis.
+                streamlines.append(fbr_pil @ Converter._FBR_TO_RAS.T)
 
-                fbr_pil = np.array(fiber['points'], dtype=np.float32)
-                # flip axes + axe orient = (x_ras = -z_pil, y_ras = -x_pil, z_ras = -y_pil)
-                trk_x, trk_y, trk_z = -fbr_pil[:, 2], -fbr_pil[:, 0], -fbr_pil[:, 1]
-
-                streamline_ras_space = np.column_stack((trk_x, trk_y, trk_z))
-                streamlines.append(streamline_ras_space.astype(np.float32))
-
+        if img is not None:
+            streamlines = Converter._correct_and_filter_fbr(streamlines, img)
         return streamlines
\ No newline at end of file
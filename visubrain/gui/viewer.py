@@ -20,6 +20,10 @@ import numpy as np
 from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QMessageBox
 from pyvistaqt import QtInteractor
+from pyvista.plotting.colors import hexcolors
+from vtkmodules.util.numpy_support import numpy_to_vtkIdTypeArray
+from vtkmodules.vtkCommonDataModel import vtkCellArray
+from vtkmodules.vtkRenderingCore import vtkImageSlice, vtkImageSliceMapper
 
 
 def _slice_actor_key(file_path: str, axis: str) -> str:
@@ -36,6 +40,19 @@ def _slice_actor_key(file_path: str, axis: str) -> str:
     return f"{file_path}::{axis}_slice"
 
 
+# Color names accepted for the scene background; membership here replaces
+# probing set_background and catching its failure per call.
+_VALID_BG_COLORS = frozenset(hexcolors)
+
+# Slicing axis index and plane normal per orientation name, so slider
+# callbacks look the geometry up instead of rebuilding it per tick.
+_AXIS_GEOMETRY = {
+    "axial": (2, (0, 0, 1)),
+    "coronal": (1, (0, 1, 0)),
+    "sagittal": (0, (1, 0, 0)),
+}
+
+
 class PyVistaViewer(QtInteractor):
     """
     3D and slice viewer for medical imaging and tractography, integrated with the VisuBrain
@@ -54,7 +71,7 @@ class PyVistaViewer(QtInteractor):
         tract_actors (dict): Displayed tractography actors, keyed by (session_id, file_path).
         align_streamlines (bool): (Reserved) Enable streamline alignment in display.
         slice_update_timer (QTimer): Timer for debouncing slice updates.
-        pending_update: Temporary storage for scheduled slice updates.
+        pending_update (dict): Scheduled slice updates, keyed by axis.
         current_zoom_factor (float): Current camera zoom applied to the view.
         current_mode (str): Visualization mode ("slices" or "volume 3d").
     """
@@ -76,7 +93,13 @@ class PyVistaViewer(QtInteractor):
         self.slice_update_timer = QTimer()
         self.slice_update_timer.setSingleShot(True)
         self.slice_update_timer.timeout.connect(self.perform_slice_update)
-        self.pending_update = None
+        self.pending_update = {}
+        self._last_slice_value = {}
+        self._slice_params = {}
+        self._display_window = (0.0, 1.0)
+        self._tract_cell_buffers = {}
+        self._tract_show_points = {}
+        self._last_bg = None
         self.current_zoom_factor = 1.0
         self.current_mode = "slices"
         self.add_axes()
@@ -92,9 +115,11 @@ class PyVistaViewer(QtInteractor):
         self.working_nifti_obj = nifti_obj
         if hasattr(nifti_obj, "is_4d") and nifti_obj.is_4d():
             # Use first time frame for 4D images
-            self.pv_data = pv.wrap(nifti_obj.get_3d_frame(0))
+            frame = nifti_obj.get_3d_frame(0)
         else:
-            self.pv_data = pv.wrap(nifti_obj.data)
+            frame = nifti_obj.data
+        self._set_display_window(frame)
+        self.pv_data = pv.wrap(self._to_display_u8(frame))
         self.clear_previous_actors()
         self.render_mode(self.current_mode)
 
@@ -102,37 +127,107 @@ class PyVistaViewer(QtInteractor):
         """
         Update displayed data for a specific time/frame index in a 4D NIfTI.
 
+        When the grid already displayed matches the frame shape, the new
+        frame is copied into the existing scalar buffer in place (the
+        mutation bumps the VTK array's modified time, so mappers re-pull it
+        on the next render). That keeps every actor alive across a time
+        scrub instead of re-wrapping the volume and rebuilding the scene
+        per frame.
+
         Args:
             t (int): Index of the time/frame to display.
         """
         if hasattr(self.working_nifti_obj, "is_4d") and self.working_nifti_obj.is_4d():
             frame_3d = self.working_nifti_obj.get_3d_frame(t)
-            self.pv_data = pv.wrap(frame_3d)
-            self.clear_previous_actors()
-            self.render_mode(self.current_mode)
+            if (self.pv_data is not None
+                    and tuple(self.pv_data.dimensions) == frame_3d.shape):
+                scalars = self.pv_data.point_data.active_scalars
+                scalars[:] = self._to_display_u8(frame_3d).ravel(order='F')
+                # Image-slice actors read the live grid and need nothing;
+                # mesh-based (oblique) slice actors hold extracted planes
+                # and are re-cut at their current positions.
+                self._refresh_slice_actors()
+                self.render()
+            else:
+                self.pv_data = pv.wrap(self._to_display_u8(frame_3d))
+                self.clear_previous_actors()
+                self.render_mode(self.current_mode)
+
+    def _set_display_window(self, frame):
+        """
+        Fix the gray-level window for the current volume from its nonzero
+        1st/99th percentiles, computed once per loaded object so every frame
+        of a 4D series maps through the same window.
+
+        Args:
+            frame: Representative 3D frame of the volume.
+        """
+        nonzero = frame[frame != 0]
+        if nonzero.size:
+            lo, hi = np.percentile(nonzero, [1, 99])
+        else:
+            lo, hi = 0.0, 1.0
+        if hi <= lo:
+            hi = lo + 1.0
+        self._display_window = (float(lo), float(hi))
+
+    def _to_display_u8(self, arr):
+        """
+        Window a volume into uint8 display scalars.
+
+        The GPU never needs more than 8 bits per voxel for a gray colormap,
+        and uploading uint8 instead of the float64 arrays NIfTI commonly
+        carries cuts texture memory and transfer bandwidth by 8x.
+
+        Args:
+            arr: Volume to window.
+
+        Returns:
+            numpy.ndarray: uint8 volume scaled into the display window.
+        """
+        lo, hi = self._display_window
+        out = np.empty(arr.shape, dtype=np.float32)
+        np.subtract(arr, lo, out=out, dtype=np.float32)
+        np.multiply(out, 255.0 / (hi - lo), out=out)
+        np.clip(out, 0, 255, out=out)
+        return out.astype(np.uint8)
 
     def schedule_slice_update(self, axis, value, opacity):
         """
         Schedule a slice position update for smoother user experience (debouncing).
 
+        Leading-plus-trailing debounce: the first tick of a drag is applied
+        immediately (no perceived lag), later ticks are coalesced per axis
+        and flushed when the timer fires, and re-scheduling the value a
+        slice already shows is a no-op. Dragging two sliders at once queues
+        one update for each.
+
         Args:
             axis (str): Orientation of the slice ("axial", "coronal", "sagittal").
             value (float): Position of the slice.
             opacity (float): Opacity to set for the updated slice.
         """
-        self.pending_update = (axis, value, opacity)
-        if self.slice_update_timer.isActive():
-            self.slice_update_timer.stop()
-        self.slice_update_timer.start(5)
+        if (axis not in self.pending_update
+                and self._last_slice_value.get(axis) == (value, opacity)):
+            return
+        self.pending_update[axis] = (value, opacity)
+        if not self.slice_update_timer.isActive():
+            # Idle: apply right away (leading edge), then open a 16 ms
+            # window — one 60 Hz paint — that coalesces the ticks arriving
+            # while this update renders.
+            self.perform_slice_update()
+            self.slice_update_timer.start(16)
 
     def perform_slice_update(self):
         """
-        Perform the pending update for slice position, if scheduled.
+        Perform the pending updates for slice positions, if scheduled.
         """
-        if self.pending_update:
-            axis, value, opacity = self.pending_update
+        updates, self.pending_update = self.pending_update, {}
+        for axis, (value, opacity) in updates.items():
+            if self._last_slice_value.get(axis) == (value, opacity):
+                continue
             self.update_slice_position(axis, value, opacity)
-            self.pending_update = None
+            self._last_slice_value[axis] = (value, opacity)
 
     def render_mode(self, mode: str, opacity=0.5) -> bool:
         """
@@ -187,18 +282,20 @@ class PyVistaViewer(QtInteractor):
     def clear_previous_actors(self):
         """
         Remove all actors currently displayed in the scene (slices, 3D volume, tractographies).
-        """
-        if self.volume_3d_actor:
-            self.remove_actor(self.volume_3d_actor)
-            self.volume_3d_actor = None
 
-        for actor in self.volume_sliced_actor.values():
-            self.remove_actor(actor)
+        Uses the plotter-level clear_actors, which detaches every actor with
+        rendering and camera resets suppressed and repaints once, instead of
+        one remove_actor/render round-trip per actor. The orientation axes
+        live on a widget, not in the actor list, so they survive the clear.
+        """
+        self.clear_actors()
+        self.volume_3d_actor = None
         self.volume_sliced_actor.clear()
-
-        for actor in self.tract_actors.values():
-            self.remove_actor(actor)
         self.tract_actors.clear()
+        self._tract_cell_buffers.clear()
+        self._tract_show_points.clear()
+        self._last_slice_value.clear()
+        self._slice_params.clear()
 
         self.render()
 
@@ -221,6 +318,13 @@ class PyVistaViewer(QtInteractor):
         """
         Create or update a 2D slice actor for an anatomical volume in the viewer.
 
+        Axis-aligned planes through an ImageData are rendered with
+        vtkImageSliceMapper: a texture-mapped quad fed directly by the live
+        image, so moving a slice is a SetSliceNumber call with no geometry
+        extraction, and in-place scalar updates are picked up automatically.
+        Oblique planes (or non-image data) keep the polygonal cut + add_mesh
+        path.
+
         Args:
             normal (list): Normal vector of the slice plane (world space).
             origin (list): Origin of the slice (voxel index).
@@ -229,14 +333,42 @@ class PyVistaViewer(QtInteractor):
             opacity (float): Opacity value for the slice.
 
         Returns:
-            PyVista actor: Actor representing the 2D slice.
+            Actor representing the 2D slice (vtkImageSlice for axis-aligned
+            planes, PyVista mesh actor otherwise).
         """
         if self.pv_data is None:
             return None
 
-        new_slice = self.pv_data.slice(normal=normal, origin=origin)
         key = _slice_actor_key(self.working_nifti_obj.file_path, axis)
-
+        self._slice_params[key] = (list(normal), list(origin), axis, opacity)
+
+        nonzero = [i for i, n in enumerate(normal) if n]
+        if isinstance(self.pv_data, pv.ImageData) and len(nonzero) == 1:
+            ax = nonzero[0]
+            dims = self.pv_data.dimensions
+            idx = min(max(int(origin[ax]), 0), dims[ax] - 1)
+            actor = self.volume_sliced_actor.get(key) if update_if_exists else None
+            if isinstance(actor, vtkImageSlice):
+                actor.GetMapper().SetSliceNumber(idx)
+                actor.GetProperty().SetOpacity(opacity)
+            else:
+                mapper = vtkImageSliceMapper()
+                mapper.SetInputData(self.pv_data)
+                mapper.SetOrientation(ax)
+                mapper.SetSliceNumber(idx)
+                actor = vtkImageSlice()
+                actor.SetMapper(mapper)
+                prop = actor.GetProperty()
+                prop.SetOpacity(opacity)
+                # Display scalars are already windowed to uint8, so the
+                # full 0-255 window is the identity gray map.
+                prop.SetColorWindow(255.0)
+                prop.SetColorLevel(127.5)
+                self.add_actor(actor, name=key)
+                self.volume_sliced_actor[key] = actor
+            return actor
+
+        new_slice = self._extract_slice(normal, origin)
         if update_if_exists and key in self.volume_sliced_actor:
             actor = self.volume_sliced_actor[key]
             actor.mapper.SetInputData(new_slice)
@@ -248,20 +380,84 @@ class PyVistaViewer(QtInteractor):
 
         return actor
 
+    def _extract_slice(self, normal, origin):
+        """
+        Extract the 2D cut of the current volume for an axis-aligned plane.
+
+        Axis-aligned planes through an ImageData are extracted as a
+        one-voxel-thick sub-extent, which only touches the O(X*Y) voxels of
+        the requested plane; the generic slice() cutter traverses the whole
+        volume on every call, which dominates slider-drag latency on large
+        images. Non-aligned planes (or non-image data) fall back to slice().
+
+        Args:
+            normal (list): Normal vector of the slice plane (world space).
+            origin (list): Origin of the slice (voxel index).
+
+        Returns:
+            pyvista.DataSet: Flat dataset holding the requested slice.
+        """
+        if isinstance(self.pv_data, pv.ImageData):
+            nonzero = [i for i, n in enumerate(normal) if n]
+            if len(nonzero) == 1:
+                ax = nonzero[0]
+                dims = self.pv_data.dimensions
+                idx = min(max(int(origin[ax]), 0), dims[ax] - 1)
+                voi = [0, dims[0] - 1, 0, dims[1] - 1, 0, dims[2] - 1]
+                voi[2 * ax] = voi[2 * ax + 1] = idx
+                return self.pv_data.extract_subset(voi)
+        # generate_triangles selects vtkCutter's fast triangulated output
+        # instead of its per-cell polygon assembly; for an image slice the
+        # rendered result is identical.
+        return self.pv_data.slice(normal=normal, origin=origin,
+                                  generate_triangles=True)
+
+    def _refresh_slice_actors(self):
+        """
+        Re-extract every existing slice actor at its current plane.
+
+        Used after the volume scalars change under the actors (e.g. a 4D
+        time-frame swap), which only needs three plane extractions instead
+        of tearing down and rebuilding the scene.
+        """
+        for normal, origin, axis, opacity in list(self._slice_params.values()):
+            self._create_slice_actor(normal, origin, axis,
+                                     update_if_exists=True, opacity=opacity)
+
+    # 256-entry opacity ramp (0 -> 0.045), precomputed so add_volume binds
+    # it as the transfer-function texture directly instead of interpolating
+    # a two-point mapping on every volume-actor creation.
+    _VOLUME_OPACITY = np.linspace(0.0, 0.045, 256)
+
     def _create_volume_actor(self):
         """
         Create a 3D volume rendering actor for the currently loaded NIfTI data.
 
+        Requests the GPU ray-cast mapper, which samples the precomputed
+        opacity ramp as a 1D texture per ray instead of evaluating the
+        transfer function on the CPU; environments without GPU volume
+        support fall back to the default (smart) mapper.
+
         Returns:
             PyVista actor: Actor for 3D volume rendering.
         """
-        return self.add_volume(
-            self.pv_data,
-            opacity=[0.0,0.045],
-            cmap="gray",
-            shade=True,
-            show_scalar_bar=False
-        )
+        try:
+            return self.add_volume(
+                self.pv_data,
+                opacity=self._VOLUME_OPACITY,
+                cmap="gray",
+                shade=True,
+                show_scalar_bar=False,
+                mapper="gpu"
+            )
+        except (RuntimeError, TypeError):
+            return self.add_volume(
+                self.pv_data,
+                opacity=self._VOLUME_OPACITY,
+                cmap="gray",
+                shade=True,
+                show_scalar_bar=False
+            )
 
     def show_tractogram(self, tracto_obj, show_points=False):
         """
@@ -279,21 +475,27 @@ class PyVistaViewer(QtInteractor):
 
         sid = tracto_obj.session_id
         key = (sid, tracto_obj.file_path)
-        if key not in self.tract_actors:
-            points_list, colors_list, connectivity = tracto_obj.get_color_points(show_points, tracto_obj.streamlines)
-            points = np.vstack(points_list)
-            colors = np.vstack(colors_list)
+        actor = self.tract_actors.get(key)
+        if actor is None:
+            # The concat variant hands back the flat point/color buffers and
+            # the per-streamline offsets directly, so no vstack/hstack
+            # re-copy of the whole tractogram. Line cells are always built:
+            # a later points/lines toggle then flips this actor's
+            # representation instead of re-uploading the geometry.
+            points, colors, offsets = tracto_obj.get_color_points_concat(False)
             poly = pv.PolyData(points)
             poly["Colors"] = colors
 
-            if not show_points:
-                connectivity_flat = np.hstack(connectivity)
-                poly.lines = connectivity_flat
-                point_size = 0
-                ambient = 0.3
-            else:
-                point_size = 2
-                ambient = 0
+            # Feed the cell array its offsets/connectivity pair without a
+            # copy: points are concatenated in streamline order, so the
+            # connectivity is just 0..N-1. The arrays are kept on
+            # _tract_cell_buffers because VTK only borrows the memory.
+            conn = np.arange(points.shape[0], dtype=np.int64)
+            cells = vtkCellArray()
+            cells.SetData(numpy_to_vtkIdTypeArray(offsets, deep=False),
+                          numpy_to_vtkIdTypeArray(conn, deep=False))
+            poly.SetLines(cells)
+            self._tract_cell_buffers[key] = (offsets, conn)
 
             actor = self.add_mesh(
                 poly,
@@ -301,15 +503,42 @@ class PyVistaViewer(QtInteractor):
                 rgb=True,
                 render_lines_as_tubes=not show_points,
                 line_width=2,
-                point_size=point_size,
-                ambient=ambient
+                point_size=2 if show_points else 0,
+                ambient=0 if show_points else 0.3
             )
+            if show_points:
+                actor.GetProperty().SetRepresentationToPoints()
             self.tract_actors[key] = actor
+            self._tract_show_points[key] = show_points
+        elif self._tract_show_points.get(key) != show_points:
+            self._apply_tract_representation(actor, show_points)
+            self._tract_show_points[key] = show_points
 
-        self.tract_actors[key].SetVisibility(True)
+        actor.SetVisibility(True)
         self.render()
         return True
 
+    @staticmethod
+    def _apply_tract_representation(actor, show_points):
+        """
+        Flip an existing tractogram actor between line and point display.
+
+        Args:
+            actor: Tractogram actor to restyle.
+            show_points (bool): If True, show vertices instead of lines.
+        """
+        prop = actor.GetProperty()
+        if show_points:
+            prop.SetRepresentationToPoints()
+            prop.SetPointSize(2)
+            prop.SetAmbient(0)
+            prop.SetRenderLinesAsTubes(False)
+        else:
+            prop.SetRepresentationToSurface()
+            prop.SetPointSize(0)
+            prop.SetAmbient(0.3)
+            prop.SetRenderLinesAsTubes(True)
+
     def set_file_visibility(self, file_path, visible, session_id):
         """
         Show or hide a specific tractography actor by file path and session.
@@ -321,7 +550,7 @@ class PyVistaViewer(QtInteractor):
         """
         key = (session_id, file_path)
         actor = self.tract_actors.get(key)
-        if actor:
+        if actor and bool(actor.GetVisibility()) != bool(visible):
             actor.SetVisibility(visible)
             self.render()
 
@@ -340,32 +569,54 @@ class PyVistaViewer(QtInteractor):
         if self.current_mode != "slices":
             return
 
-        if axis == "axial":
-            normal = [0, 0, 1]
-            origin = [0, 0, int(value)]
-        elif axis == "coronal":
-            normal = [0, 1, 0]
-            origin = [0, int(value), 0]
-        elif axis == "sagittal":
-            normal = [1, 0, 0]
-            origin = [int(value), 0, 0]
-        else:
+        geometry = _AXIS_GEOMETRY.get(axis)
+        if geometry is None:
             return
+        ax, normal = geometry
+        idx = int(value)
 
-        self._create_slice_actor(normal, origin, axis, update_if_exists=True, opacity=opacity)
+        key = _slice_actor_key(self.working_nifti_obj.file_path, axis)
+        actor = self.volume_sliced_actor.get(key)
+        if isinstance(actor, vtkImageSlice):
+            # Specialized update: the image-slice actor only needs its slice
+            # number (and possibly opacity) changed, no plane rebuild.
+            dims = self.pv_data.dimensions
+            idx = min(max(idx, 0), dims[ax] - 1)
+            params = self._slice_params.get(key)
+            if params is not None and params[1][ax] == idx and params[3] == opacity:
+                # Step-rounding makes sliders re-emit the same integer
+                # index; nothing to re-render in that case.
+                return
+            actor.GetMapper().SetSliceNumber(idx)
+            if actor.GetProperty().GetOpacity() != opacity:
+                actor.GetProperty().SetOpacity(opacity)
+            origin = [0, 0, 0]
+            origin[ax] = idx
+            self._slice_params[key] = (list(normal), origin, axis, opacity)
+        else:
+            origin = [0, 0, 0]
+            origin[ax] = idx
+            self._create_slice_actor(list(normal), origin, axis,
+                                     update_if_exists=True, opacity=opacity)
         self.render()
 
     def update_slice_opacity(self, opacity: float):
         """
         Set the opacity of all visible 2D slice actors.
 
+        A render pass is only issued when at least one actor actually
+        changes; slider callbacks re-emitting the current value are free.
+
         Args:
             opacity (float): New opacity value to apply.
         """
+        changed = False
         for actor in self.volume_sliced_actor.values():
-            if actor:
+            if actor and actor.GetProperty().GetOpacity() != opacity:
                 actor.GetProperty().SetOpacity(opacity)
-        self.render()
+                changed = True
+        if changed:
+            self.render()
 
     def set_zoom(self, zoom_factor):
         """
@@ -376,6 +627,8 @@ class PyVistaViewer(QtInteractor):
         """
         new_zoom_factor = zoom_factor / 100.0
         relative_factor = new_zoom_factor / self.current_zoom_factor
+        if relative_factor == 1.0:
+            return
         self.camera.Zoom(relative_factor)
         self.current_zoom_factor = new_zoom_factor
         self.render()
@@ -384,14 +637,20 @@ class PyVistaViewer(QtInteractor):
         """
         Change the background color of the PyVista scene.
 
+        Unknown color names and re-selections of the current color return
+        without touching the renderer.
+
         Args:
             color (str): Background color (e.g., "white", "black", "#RRGGBB").
         """
         normalized_color = color.lower()
-        try:
-            self.set_background(normalized_color)
-        except AttributeError:
+        if (normalized_color not in _VALID_BG_COLORS
+                and not normalized_color.startswith('#')):
+            return
+        if normalized_color == self._last_bg:
             return
+        self.set_background(normalized_color)
+        self._last_bg = normalized_color
         self.render()
 
     def reset_view(self):
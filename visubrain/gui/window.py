@@ -21,15 +21,95 @@ from PyQt6.QtWidgets import (
     QHBoxLayout, QSlider, QLineEdit, QComboBox, QCheckBox, QMenuBar, QMenu,
     QMessageBox, QDialog, QTextEdit, QDialogButtonBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThread, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction
 
-from visubrain.gui.viewer import PyVistaViewer
 from visubrain.utils.session import Session
 from visubrain.utils.slice_controller import SliceControl
-from visubrain.core.converter import Converter
-from visubrain.io.nifti import NiftiFile
-from visubrain.io.tractography import Tractography
+
+# PyVistaViewer, NiftiFile, Tractography and Converter drag in VTK/PyVista,
+# nibabel and dipy; they are imported inside the methods that first need them
+# so the window (and the Qt event loop) comes up without paying for the whole
+# scientific stack at startup.
+
+
+class _LoadWorkerSignals(QObject):
+    """
+    Signal holder for _LoadWorker.
+
+    QRunnable cannot carry signals itself, so the worker owns one of these
+    and the window connects to it before the runnable is started.
+    """
+    loaded = pyqtSignal(object, str)
+    failed = pyqtSignal(str)
+
+
+class _LoadWorker(QRunnable):
+    """
+    Worker constructing one data object (NiftiFile, Tractography) off the GUI
+    thread.
+
+    Decompressing a large .nii.gz or parsing a multi-million-streamline .trk
+    can take seconds; running the constructor on the global QThreadPool keeps
+    the event loop responsive while the file is read.
+    """
+
+    def __init__(self, factory, file_path, *args, **kwargs):
+        """
+        Initialize the worker with the object factory and its arguments.
+
+        Args:
+            factory: Callable building the data object (e.g. NiftiFile).
+            file_path (str): Path to the file, passed first to the factory
+                and echoed back with the loaded signal.
+            *args: Extra positional arguments for the factory.
+            **kwargs: Extra keyword arguments for the factory.
+        """
+        super().__init__()
+        self.signals = _LoadWorkerSignals()
+        self._factory = factory
+        self._file_path = file_path
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self):
+        """Build the object and report the outcome through the signals."""
+        try:
+            obj = self._factory(self._file_path, *self._args, **self._kwargs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.loaded.emit(obj, self._file_path)
+
+
+class _ConvertWorker(QObject):
+    """
+    Worker running one file conversion outside the GUI thread.
+
+    Large .trk/.tck conversions take seconds; running them on the main thread
+    would freeze the event loop, so the converter tab moves this worker to a
+    QThread and reacts to its signals instead.
+    """
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def __init__(self, converter):
+        """
+        Initialize the worker with a ready-to-run converter.
+
+        Args:
+            converter (Converter): Configured converter instance.
+        """
+        super().__init__()
+        self._converter = converter
+
+    def run(self):
+        """Run the conversion and report the outcome through signals."""
+        try:
+            self._converter.convert()
+            self.finished.emit()
+        except Exception as e:
+            self.error.emit(str(e))
 
 
 class WindowApp(QWidget):
@@ -57,17 +137,22 @@ class WindowApp(QWidget):
         checkbox.
     """
 
+    # License text read once per process; the dialog is built once per window.
+    _license_text = None
+
     def __init__(self):
         """
         Initialize the main application window, layouts, and all interactive GUI controls.
         """
         super().__init__()
+        self._license_dialog = None
 
         # main app layout
         self.setWindowTitle("VisuBrain")
         self.setGeometry(20, 20, 3000, 900)
         self._main_layout = QVBoxLayout()
 
+        from visubrain.gui.viewer import PyVistaViewer
         self._viewer = PyVistaViewer(self)
         self._sessions = []
         self._current_session = None
@@ -207,6 +292,13 @@ class WindowApp(QWidget):
         # Paramètre pour l'opacité des slices
         opacity_layout = QHBoxLayout()
         opacity_label = QLabel("Slices opacity:")
+        # Coalesces the ~100 valueChanged ticks of a slider sweep into one
+        # viewer update per frame; the session opacity itself is still
+        # recorded on every tick.
+        self._opacity_timer = QTimer(self)
+        self._opacity_timer.setSingleShot(True)
+        self._opacity_timer.setInterval(16)
+        self._opacity_timer.timeout.connect(self._flush_slice_opacity)
         self._opacity_slider.setMinimum(0)
         self._opacity_slider.setMaximum(100)
         self._opacity_slider.setSingleStep(1)
@@ -245,7 +337,14 @@ class WindowApp(QWidget):
         self.zoom_slider.setMinimum(50)
         self.zoom_slider.setMaximum(500)
         self.zoom_slider.setValue(100)
-        self.zoom_slider.valueChanged.connect(self._viewer.set_zoom)
+        # Same coalescing as the opacity slider: one camera update per frame
+        # instead of one per integer step of a 50-500 drag.
+        self._pending_zoom = 100
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._flush_zoom)
+        self.zoom_slider.valueChanged.connect(self._queue_zoom)
         zoom_layout.addWidget(self.zoom_slider)
         self._right_control_panel.addLayout(zoom_layout)
 
@@ -276,84 +375,123 @@ class WindowApp(QWidget):
 
     def _on_view_license(self):
         """
-        Display the VisuBrain license in a modal dialog.
+        Display the VisuBrain license in a dialog.
+
+        The license text is read from disk only on the first call and the
+        dialog is built once and re-shown afterwards, so repeated clicks cost
+        neither file I/O nor widget construction.
         """
-        try:
-            license_path = Path(__file__).parent.parent.parent / "LICENSE.txt"
-            with open(license_path, 'r') as file:
-                license_text = file.read()
-        except Exception as e:
-            license_text = f"Error reading license file: {e}"
-        dialog = QDialog(self)
-        dialog.setWindowTitle("License")
-        dialog.resize(600, 400)
-        layout = QVBoxLayout()
-        text_edit = QTextEdit()
-        text_edit.setPlainText(license_text)
-        text_edit.setReadOnly(True)
-        layout.addWidget(text_edit)
-        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
-        button_box.accepted.connect(dialog.accept)
-        layout.addWidget(button_box)
-        dialog.setLayout(layout)
-        dialog.exec()
+        if WindowApp._license_text is None:
+            try:
+                license_path = Path(__file__).parent.parent.parent / "LICENSE.txt"
+                with open(license_path, 'r') as file:
+                    WindowApp._license_text = file.read()
+            except Exception as e:
+                WindowApp._license_text = f"Error reading license file: {e}"
+        if self._license_dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("License")
+            dialog.resize(600, 400)
+            layout = QVBoxLayout()
+            text_edit = QTextEdit()
+            text_edit.setPlainText(WindowApp._license_text)
+            text_edit.setReadOnly(True)
+            layout.addWidget(text_edit)
+            button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
+            button_box.accepted.connect(dialog.accept)
+            layout.addWidget(button_box)
+            dialog.setLayout(layout)
+            self._license_dialog = dialog
+        self._license_dialog.show()
+        self._license_dialog.raise_()
 
     def _on_load_volume(self):
         """
         Open a file dialog to load a NIfTI anatomical volume, creating a new Session.
 
-        On successful loading, resets or creates a new session, updates all GUI controls,
-        and synchronizes the 3D viewer.
+        The NiftiFile constructor (disk read, gunzip) runs on the global
+        QThreadPool so the GUI stays responsive; _finish_load_volume wires up
+        the session and viewer once the file is loaded.
         """
         file_path, _ = QFileDialog.getOpenFileName(self, "Add a volume/anatomical file", "",
                                                    "(*.nii *.nii.gz)")
-        if file_path:
-            try:
-                nifti_object = NiftiFile(file_path)
-
-                if not nifti_object:
-                    return
-
-                if len(nifti_object.get_dimensions()) not in (3, 4):
-                    QMessageBox.critical(self, "Erreur", "Bad file dimension (only 3D/4D)")
-                    return
-                if len(nifti_object.get_dimensions()) == 4:
-                    tmax = nifti_object.get_dimensions()[3]
-                    self.time_slider.setMaximum(tmax - 1)
-                    self.time_slider.setValue(0)
-                    self.time_slider.setVisible(True)
-                    self.label_time_slider.setVisible(True)
-                else:
-                    self.time_slider.setVisible(False)
-                    self.label_time_slider.setVisible(False)
-
-                tracto_path_list = []
-                if self._current_session and self._current_session.volume_obj is None:
-                    index = self.session_selector.currentIndex()
-                    for tp in self._current_session.tracts.keys():
-                        tracto_path_list.append(tp)
-                    self._sessions.remove(self._current_session)
-                    self.session_selector.removeItem(index)
-
-                self._viewer.clear_previous_actors()
-                filename = Path(file_path).name
-                self._create_session(nifti_object, filename)
-                self._viewer.set_working_nifti_obj(nifti_object)
-                self._set_sliders_values(nifti_object.get_dimensions())
-                self._viewer.render_mode(self.mode_button.currentText())
-                self._set_slice_controls_enabled(self.mode_button.currentText().lower()=="slices")
-
-                for tp in tracto_path_list:
-                    to = Tractography(tp,
-                                      self._current_session.get_uid(),
-                                      reference_nifti=nifti_object)
-                    self._current_session.add_tract(to)
-                    self._viewer.show_tractogram(to)
-                    self.add_tracto_checkbox(tp)
-                self._current_session.apply()
-            except:
-                QMessageBox.critical(self, "Erreur", "Error loading volume file")
+        if not file_path:
+            return
+        from visubrain.io.nifti import NiftiFile
+        worker = _LoadWorker(NiftiFile, file_path)
+        worker.signals.loaded.connect(self._finish_load_volume)
+        worker.signals.failed.connect(self._on_load_volume_error)
+        # Keep the signal holder referenced until the worker reports back.
+        self._volume_load_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_load_volume_error(self, message):
+        """
+        Report a failed volume load.
+
+        Args:
+            message (str): Error description emitted by the worker. (unused,
+                the dialog shows a generic message as before)
+        """
+        QMessageBox.critical(self, "Erreur", "Error loading volume file")
+
+    def _finish_load_volume(self, nifti_object, file_path):
+        """
+        Finish the volume load on the GUI thread: session, controls, viewer.
+
+        On successful loading, resets or creates a new session, updates all GUI controls,
+        and synchronizes the 3D viewer.
+
+        Args:
+            nifti_object (NiftiFile): Volume loaded by the worker.
+            file_path (str): Path of the loaded file.
+        """
+        try:
+            from visubrain.io.tractography import Tractography
+
+            if not nifti_object:
+                return
+
+            if len(nifti_object.get_dimensions()) not in (3, 4):
+                QMessageBox.critical(self, "Erreur", "Bad file dimension (only 3D/4D)")
                 return
+            if len(nifti_object.get_dimensions()) == 4:
+                tmax = nifti_object.get_dimensions()[3]
+                self.time_slider.setMaximum(tmax - 1)
+                self.time_slider.setValue(0)
+                self.time_slider.setVisible(True)
+                self.label_time_slider.setVisible(True)
+            else:
+                self.time_slider.setVisible(False)
+                self.label_time_slider.setVisible(False)
+
+            tracto_path_list = []
+            if self._current_session and self._current_session.volume_obj is None:
+                index = self.session_selector.currentIndex()
+                for tp in self._current_session.tracts.keys():
+                    tracto_path_list.append(tp)
+                self._sessions.remove(self._current_session)
+                self.session_selector.removeItem(index)
+
+            self._viewer.clear_previous_actors()
+            filename = Path(file_path).name
+            self._create_session(nifti_object, filename)
+            self._viewer.set_working_nifti_obj(nifti_object)
+            self._set_sliders_values(nifti_object.get_dimensions())
+            self._viewer.render_mode(self.mode_button.currentText())
+            self._set_slice_controls_enabled(self.mode_button.currentText().lower()=="slices")
+
+            for tp in tracto_path_list:
+                to = Tractography(tp,
+                                  self._current_session.get_uid(),
+                                  reference_nifti=nifti_object)
+                self._current_session.add_tract(to)
+                self._viewer.show_tractogram(to)
+                self.add_tracto_checkbox(tp)
+            self._current_session.apply()
+        except Exception:
+            QMessageBox.critical(self, "Erreur", "Error loading volume file")
+            return
 
     def _set_sliders_values(self, dimensions):
         """
@@ -385,8 +523,32 @@ class WindowApp(QWidget):
         """
         self._current_session.opacity = value / 100.0 # valeur flottante entre 0 et 1
         if self._viewer.working_nifti_obj:
+            self._opacity_timer.start()
+
+    def _flush_slice_opacity(self):
+        """
+        Push the latest session opacity to the viewer slices.
+
+        Runs on the debounce timer so a full slider sweep triggers a handful
+        of actor updates instead of one per integer tick.
+        """
+        if self._current_session and self._viewer.working_nifti_obj:
             self._viewer.update_slice_opacity(self._current_session.opacity)
 
+    def _queue_zoom(self, value):
+        """
+        Record the latest zoom slider value and arm the debounce timer.
+
+        Args:
+            value (int): Zoom percentage from the slider (50-500).
+        """
+        self._pending_zoom = value
+        self._zoom_timer.start()
+
+    def _flush_zoom(self):
+        """Apply the most recent pending zoom value to the viewer camera."""
+        self._viewer.set_zoom(self._pending_zoom)
+
     def reset_cam_zoom(self):
         """
         Reset the viewer's camera zoom to default (100%).
@@ -411,6 +573,8 @@ class WindowApp(QWidget):
         Open a file dialog to load a tractography file (TRK or TCK) into the current session.
 
         Will create a session if necessary and handle multiple tractographies per session.
+        The Tractography constructor itself (parsing, registration) runs on
+        the global QThreadPool; _finish_load_streamlines attaches the result.
         """
         file_path, _ = QFileDialog.getOpenFileName(self, "Add a tractography file", "",
                                                    "(*.trk *.tck)")
@@ -427,27 +591,45 @@ class WindowApp(QWidget):
                                         f" dans cette session.")
                 return
 
-            try:
-                tracto_obj = Tractography(file_path,
-                                          self._current_session.get_uid(),
-                                          reference_nifti=self._viewer.working_nifti_obj)
-            except Exception as e:
-                QMessageBox.information(self, "Error loading tractography file", f"{e}")
-                return
+            from visubrain.io.tractography import Tractography
+            worker = _LoadWorker(Tractography, file_path,
+                                 self._current_session.get_uid(),
+                                 reference_nifti=self._viewer.working_nifti_obj)
+            worker.signals.loaded.connect(self._finish_load_streamlines)
+            worker.signals.failed.connect(self._on_load_streamlines_error)
+            self._tract_load_worker = worker
+            QThreadPool.globalInstance().start(worker)
 
-            if not tracto_obj:
-                return
+    def _on_load_streamlines_error(self, message):
+        """
+        Report a failed tractography load.
 
-            if self._current_session:
-                self._current_session.add_tract(tracto_obj)
-            else:
-                self._create_session(None, Path(file_path).name)
-                self._current_session.add_tract(tracto_obj)
-                self._set_slice_controls_enabled(False)
-                self.mode_button.setEnabled(False)
+        Args:
+            message (str): Error description emitted by the worker.
+        """
+        QMessageBox.information(self, "Error loading tractography file", f"{message}")
 
-            self._viewer.show_tractogram(tracto_obj)
-            self.add_tracto_checkbox(file_path)
+    def _finish_load_streamlines(self, tracto_obj, file_path):
+        """
+        Finish the tractography load on the GUI thread.
+
+        Args:
+            tracto_obj (Tractography): Tractography loaded by the worker.
+            file_path (str): Path of the loaded file.
+        """
+        if not tracto_obj:
+            return
+
+        if self._current_session:
+            self._current_session.add_tract(tracto_obj)
+        else:
+            self._create_session(None, Path(file_path).name)
+            self._current_session.add_tract(tracto_obj)
+            self._set_slice_controls_enabled(False)
+            self.mode_button.setEnabled(False)
+
+        self._viewer.show_tractogram(tracto_obj)
+        self.add_tracto_checkbox(file_path)
 
     def view_tracts_statistics(self):
         """
@@ -699,9 +881,9 @@ class WindowApp(QWidget):
         converter_layout.addLayout(h_out)
 
         # convert button
-        convert_btn = QPushButton("Convert")
-        convert_btn.clicked.connect(self._on_convert)
-        converter_layout.addWidget(convert_btn)
+        self._convert_btn = QPushButton("Convert")
+        self._convert_btn.clicked.connect(self._on_convert)
+        converter_layout.addWidget(self._convert_btn)
 
         self._converter_tab.setLayout(converter_layout)
 
@@ -714,7 +896,8 @@ class WindowApp(QWidget):
         if not path: return
         self.input_edit.setText(path)
         ext = ''.join(Path(path).suffixes).lower().lstrip('.')
-        combos = [o for (i, o) in Converter._CONVERTERS if i == ext]
+        from visubrain.core.converter import Converter
+        combos = Converter._INPUT_TO_OUTPUTS.get(ext, [])
         self.out_combo.clear()
         self.out_combo.addItems(combos)
 
@@ -738,8 +921,10 @@ class WindowApp(QWidget):
 
     def _on_convert(self):
         """
-        Perform the conversion using the selected input, output, and optional reference file.
-        Shows a message box indicating success or failure.
+        Start the conversion using the selected input, output, and optional reference file.
+
+        The conversion itself runs on a worker thread so the GUI stays
+        responsive; a message box reports success or failure when it ends.
         """
         inp = self.input_edit.text().strip()
         out = self.output_edit.text().strip()
@@ -747,9 +932,41 @@ class WindowApp(QWidget):
         if not inp or not out:
             QMessageBox.warning(self, "Error", "Please specify the two routes.")
             return
+        # Re-imported at call time so runtime replacements of the class on the
+        # module are picked up.
+        from visubrain.core.converter import Converter
         try:
             conv = Converter(inp, out, anatomical_ref=ref)
-            conv.convert()
-            QMessageBox.information(self, "Success", "Conversion successful.")
         except Exception as e:
-            QMessageBox.critical(self, "Failure", f"Conversion failed: {str(e)}")
\ No newline at end of file
+            QMessageBox.critical(self, "Failure", f"Conversion failed: {str(e)}")
+            return
+
+        self._convert_btn.setEnabled(False)
+        self._convert_thread = QThread(self)
+        self._convert_worker = _ConvertWorker(conv)
+        self._convert_worker.moveToThread(self._convert_thread)
+        self._convert_thread.started.connect(self._convert_worker.run)
+        self._convert_worker.finished.connect(self._on_convert_done)
+        self._convert_worker.error.connect(self._on_convert_error)
+        self._convert_thread.start()
+
+    def _on_convert_done(self):
+        """Tear the worker thread down and report the successful conversion."""
+        self._finish_convert_thread()
+        QMessageBox.information(self, "Success", "Conversion successful.")
+
+    def _on_convert_error(self, message):
+        """
+        Tear the worker thread down and report the failed conversion.
+
+        Args:
+            message (str): Error description emitted by the worker.
+        """
+        self._finish_convert_thread()
+        QMessageBox.critical(self, "Failure", f"Conversion failed: {message}")
+
+    def _finish_convert_thread(self):
+        """Stop the conversion thread and re-enable the Convert button."""
+        self._convert_thread.quit()
+        self._convert_thread.wait()
+        self._convert_btn.setEnabled(True)
\ No newline at end of file
@@ -12,8 +12,100 @@ Classes:
 """
 
 
+import os
 import struct
 
+import numpy as np
+
+
+class _LazyFiber(dict):
+    """
+    Fiber dict whose tuple-list keys are boxed on first access.
+
+    Decoding fills in only the 'points_np'/'colors_np' ndarray planes; the
+    legacy 'points'/'colors' lists of per-point tuples are built from them
+    the first time a consumer indexes one, so purely numeric consumers never
+    pay the O(total_points) Python boxing pass.
+    """
+
+    def __missing__(self, key):
+        if key == 'points':
+            value = list(map(tuple, self['points_np'].tolist()))
+        elif key == 'colors':
+            value = list(map(tuple, self['colors_np'].tolist()))
+        else:
+            raise KeyError(key)
+        self[key] = value
+        return value
+
+
+class _LazyFiberList:
+    """
+    List-like container that decodes FBR fibers on first access.
+
+    Holds the raw file buffer plus the byte offset and point count of each
+    fiber instead of the decoded payload, so opening a file only costs a
+    header scan; fiber bodies are decoded straight out of the shared buffer
+    and cached individually when indexed or iterated — a full pass pays one
+    read of the file, not one open/seek/read cycle per fiber.
+    """
+
+    def __init__(self, buf, fiber_index):
+        """
+        Initialize the lazy list from the file buffer and a fiber offset index.
+
+        Args:
+            buf (bytes): Raw FBR file contents the offsets index into.
+            fiber_index (list): List of (offset, num_points) tuples, one per fiber.
+        """
+        self._buf = buf
+        self._fiber_index = fiber_index
+        self._cache = [None] * len(fiber_index)
+
+    def __len__(self):
+        return len(self._fiber_index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        fiber = self._cache[index]
+        if fiber is None:
+            fiber = self._read_fiber(index)
+            self._cache[index] = fiber
+        return fiber
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def _read_fiber(self, index):
+        """
+        Decode a single fiber body from the shared file buffer.
+
+        Args:
+            index (int): Position of the fiber in the index.
+
+        Returns:
+            _LazyFiber: Fiber dictionary exposing 'points_np'/'colors_np'
+            ndarrays plus on-demand 'points'/'colors' tuple lists.
+        """
+        offset, num_points = self._fiber_index[index]
+
+        # Bulk-decode the planar X/Y/Z and R/G/B blocks with frombuffer
+        # instead of struct.unpack + Python slicing of the flat tuples.
+        coords = np.frombuffer(self._buf, dtype='<f4', count=3 * num_points,
+                               offset=offset).reshape(3, num_points)
+        colors = np.frombuffer(self._buf, dtype=np.uint8, count=3 * num_points,
+                               offset=offset + 12 * num_points).reshape(3, num_points)
+
+        # Only the contiguous (N, 3) ndarray planes are materialized here;
+        # _LazyFiber boxes the 'points'/'colors' tuple lists on demand.
+        fiber = _LazyFiber()
+        fiber['points_np'] = np.ascontiguousarray(coords.T)
+        fiber['colors_np'] = np.ascontiguousarray(colors.T)
+        return fiber
+
+
 class BinaryFbrFile:
     """
     Class for reading and writing custom FBR (fiber) binary files.
@@ -37,6 +129,9 @@ class BinaryFbrFile:
         self._num_groups = None
         self.num_fibers = None
         self.groups = []
+        self._write_handle = None
+        self._num_fibers_offset = None
+        self._appended_fibers = 0
         if fbr_file is not None:
             self._read()
 
@@ -47,118 +142,146 @@ class BinaryFbrFile:
         Raises:
             ValueError: If file is invalid or does not start with the expected magic bytes.
         """
-        with open(self._fbr_file, 'rb') as f:
-            # Read and check the magic bytes
-            self._magic = f.read(4)
-            if self._magic != b'\xa4\xd3\xc2\xb1':
-                raise ValueError("Invalid FBR file: incorrect magic bytes")
-
-            # Read header fields
-            self._file_version = struct.unpack('<I', f.read(4))[0]
-            self._coords_type = struct.unpack('<I', f.read(4))[0]
-            self.fibers_origin = struct.unpack('<3f', f.read(12))
-            self._num_groups = struct.unpack('<I', f.read(4))[0]
-
-            # Read groups
-            for _ in range(self._num_groups):
-                group = {}
-                # Read group name (null-terminated)
-                group_name = bytearray()
-                while True:
-                    char = f.read(1)
-                    if char == b'\x00':
-                        break
-                    group_name += char
-                group['name'] = group_name.decode('latin-1')
-
-                # Read group properties
-                group['visible'] = struct.unpack('<I', f.read(4))[0]
-                group['animate'] = struct.unpack('<i', f.read(4))[0]
-                group['thickness'] = struct.unpack('<f', f.read(4))[0]
-                group['color'] = struct.unpack('<3B', f.read(3))
-                num_fibers = struct.unpack('<I', f.read(4))[0]
-                self.num_fibers = num_fibers
-
-                fibers = []
-                for _ in range(num_fibers):
-                    fiber = {}
-                    num_points = struct.unpack('<I', f.read(4))[0]
-
-                    # Read fiber points (coordinates)
-                    points_data = struct.unpack(f'<{3 * num_points}f', f.read(12 * num_points))
-                    x_coords = points_data[:num_points]
-                    y_coords = points_data[num_points:2 * num_points]
-                    z_coords = points_data[2 * num_points:]
-                    fiber['points'] = list(zip(x_coords, y_coords, z_coords))
-
-                    # Read fiber colors (RGB)
-                    colors_data = struct.unpack(f'<{3 * num_points}B', f.read(3 * num_points))
-
-                    fiber['colors'] = list(zip(colors_data[:num_points],
-                                               colors_data[num_points:2 * num_points],
-                                               colors_data[2 * num_points:]))
-                    fibers.append(fiber)
-                group['fibers'] = fibers
-                self.groups.append(group)
+        # One bulk os.read into a bytes buffer: parsing then works by offset
+        # arithmetic on a memoryview, instead of one buffered read per field.
+        fd = os.open(self._fbr_file, os.O_RDONLY)
+        try:
+            buf = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        view = memoryview(buf)
+
+        # Read and check the magic bytes
+        self._magic = bytes(view[0:4])
+        if self._magic != b'\xa4\xd3\xc2\xb1':
+            raise ValueError("Invalid FBR file: incorrect magic bytes")
+
+        # Read header fields
+        self._file_version = struct.unpack_from('<I', view, 4)[0]
+        self._coords_type = struct.unpack_from('<I', view, 8)[0]
+        self.fibers_origin = struct.unpack_from('<3f', view, 12)
+        self._num_groups = struct.unpack_from('<I', view, 24)[0]
+        offset = 28
+
+        # Read groups
+        for _ in range(self._num_groups):
+            group = {}
+            # Read group name (null-terminated)
+            name_end = buf.index(b'\x00', offset)
+            group['name'] = buf[offset:name_end].decode('latin-1')
+            offset = name_end + 1
+
+            # Read group properties
+            group['visible'] = struct.unpack_from('<I', view, offset)[0]
+            group['animate'] = struct.unpack_from('<i', view, offset + 4)[0]
+            group['thickness'] = struct.unpack_from('<f', view, offset + 8)[0]
+            group['color'] = struct.unpack_from('<3B', view, offset + 12)
+            num_fibers = struct.unpack_from('<I', view, offset + 15)[0]
+            self.num_fibers = num_fibers
+            offset += 19
+
+            # Index fiber bodies (offset + point count) without decoding
+            # them; _LazyFiberList shares the file buffer and decodes each
+            # one from it on first access.
+            fiber_index = []
+            for _ in range(num_fibers):
+                num_points = struct.unpack_from('<I', view, offset)[0]
+                offset += 4
+                fiber_index.append((offset, num_points))
+                # Skip coordinates (3 floats) and colors (3 bytes) per point
+                offset += 15 * num_points
+            group['fibers'] = _LazyFiberList(buf, fiber_index)
+            self.groups.append(group)
+
+    def open_write(self, output_fbr_file_path, header):
+        """
+        Open an output file and write the file and group headers, leaving the
+        file ready for incremental append_fiber calls.
+
+        Streaming writes support a single fiber group; the fiber count of that
+        group is patched in by close_write, so callers may append fibers as
+        they are produced without holding them all in memory.
+
+        Args:
+            output_fbr_file_path (str): Output path for the FBR file.
+            header (dict): Header dictionary describing file and group properties.
+        """
+        f = open(output_fbr_file_path, 'wb')
+        self._write_handle = f
+        self._appended_fibers = 0
+
+        # Write magic bytes
+        f.write(b'\xa4\xd3\xc2\xb1')
+
+        # Write header
+        f.write(struct.pack('<I', header['FileVersion']))
+        f.write(struct.pack('<I', header['CoordsType']))
+        f.write(struct.pack('<3f', *header['FibersOrigin']))
+        f.write(struct.pack('<I', 1))
+
+        group = header['Groups'][0]
+        # Write group name (null-terminated)
+        f.write(group['Name'].encode('latin-1') + b'\x00')
+
+        # Write group properties
+        f.write(struct.pack('<I', group['Visible']))
+        f.write(struct.pack('<i', group['Animate']))
+        f.write(struct.pack('<f', group['Thickness']))
+        f.write(struct.pack('<3B', *group['Color']))
+        self._num_fibers_offset = f.tell()
+        f.write(struct.pack('<I', group.get('NrOfFibers', 0)))
+
+    def append_fiber(self, fiber):
+        """
+        Write one fiber body to the file opened by open_write.
+
+        Args:
+            fiber (dict): Fiber dictionary with 'NrOfPoints' and 'Points'.
+        """
+        f = self._write_handle
+        f.write(struct.pack('<I', fiber['NrOfPoints']))
+
+        # Bulk-encode the planar X/Y/Z then R/G/B blocks in two array casts
+        # instead of six per-point generator passes. SoA fibers carry the
+        # coordinate and color planes separately, so each is serialized from
+        # its own array without interleaving.
+        xyz = fiber.get('xyz')
+        if xyz is not None:
+            f.write(xyz.T.astype('<f4', copy=False).tobytes())
+            f.write(fiber['rgb'].T.astype(np.uint8, copy=False).tobytes())
+        else:
+            points = np.asarray(fiber['Points']).reshape(-1, 6)
+            f.write(points[:, :3].T.astype('<f4').tobytes())
+            f.write(points[:, 3:].T.astype(np.uint8).tobytes())
+        self._appended_fibers += 1
+
+    def close_write(self):
+        """Patch the group fiber count and close the file opened by open_write."""
+        f = self._write_handle
+        f.seek(self._num_fibers_offset)
+        f.write(struct.pack('<I', self._appended_fibers))
+        f.close()
+        self._write_handle = None
 
     @staticmethod
     def write_fbr(output_fbr_file_path, header, fibers):
         """
         Write fiber data to a FBR binary file in the required format.
 
+        fibers may be any iterable (including a generator): each fiber is
+        encoded and written as it is consumed, so the full decoded payload is
+        never resident at once.
+
         Args:
             output_fbr_file_path (str): Output path for the FBR file.
             header (dict): Header dictionary describing file and group properties.
-            fibers (list): List of fiber dictionaries (points and colors).
-        """
-        with open(output_fbr_file_path, 'wb') as f:
-            # Write magic bytes
-            f.write(b'\xa4\xd3\xc2\xb1')
-
-            # Write header
-            f.write(struct.pack('<I', header['FileVersion']))
-            f.write(struct.pack('<I', header['CoordsType']))
-            f.write(struct.pack('<3f', *header['FibersOrigin']))
-            f.write(struct.pack('<I', header['NrOfGroups']))
-
-            # Write groups and fibers
-            for group in header['Groups']:
-                # Write group name (null-terminated)
-                f.write(group['Name'].encode('latin-1') + b'\x00')
-
-                # Write group properties
-                f.write(struct.pack('<I', group['Visible']))
-                f.write(struct.pack('<i', group['Animate']))
-                f.write(struct.pack('<f', group['Thickness']))
-                f.write(struct.pack('<3B', *group['Color']))
-                f.write(struct.pack('<I', group['NrOfFibers']))
-
-                for fiber in fibers:
-                    f.write(struct.pack('<I', fiber['NrOfPoints']))
-
-                    # Write all X coordinates
-                    f.write(struct.pack(f'<{fiber["NrOfPoints"]}f',
-                                        *(point[0] for point in fiber['Points'])))
-
-                    # Write all Y coordinates
-                    f.write(struct.pack(f'<{fiber["NrOfPoints"]}f',
-                                        *(point[1] for point in fiber['Points'])))
-
-                    # Write all Z coordinates
-                    f.write(struct.pack(f'<{fiber["NrOfPoints"]}f',
-                                        *(point[2] for point in fiber['Points'])))
-
-                    # Write all R colors
-                    f.write(struct.pack(f'<{fiber["NrOfPoints"]}B',
-                                        *(point[3] for point in fiber['Points'])))
-
-                    # Write all G colors
-                    f.write(struct.pack(f'<{fiber["NrOfPoints"]}B',
-                                        *(point[4] for point in fiber['Points'])))
-
-                    # Write all B colors
-                    f.write(struct.pack(f'<{fiber["NrOfPoints"]}B',
-                                        *(point[5] for point in fiber['Points'])))
+            fibers (iterable): Iterable of fiber dictionaries (points and colors).
+        """
+        writer = BinaryFbrFile()
+        writer.open_write(output_fbr_file_path, header)
+        for fiber in fibers:
+            writer.append_fiber(fiber)
+        writer.close_write()
 
     def get_fiber_coordinates(self):
         """
@@ -13,6 +13,7 @@ Classes:
 
 
 import nibabel as nib
+import numpy as np
 
 
 class NiftiFile:
@@ -22,7 +23,7 @@ class NiftiFile:
     Attributes:
         file_path (str): Path to the NIfTI file.
         image (nibabel.Nifti1Image): Nibabel image object.
-        data (ndarray): Image data array.
+        data (ndarray): Image data array (materialized on first access).
         affine (ndarray): Affine matrix.
         shape (tuple): Shape of the data array.
         orient (tuple): Orientation codes (RAS, LAS, etc).
@@ -32,16 +33,40 @@ class NiftiFile:
         """
         Load a NIfTI file and extract its properties.
 
+        The voxel payload is not read here: nibabel memory-maps uncompressed
+        files, and the array proxy is kept so 4D frames can be read slice by
+        slice without ever materializing the whole series.
+
         Args:
             file_path (str): Path to the NIfTI file.
         """
         self.file_path = file_path
         self.image = nib.as_closest_canonical(nib.load(file_path))
-        self.data = self.image.get_fdata()
+        self._dataobj = getattr(self.image, "dataobj", None)
+        self._data = None
         self.affine = self.image.affine
-        self.shape = self.data.shape
+        if hasattr(self.image, "shape"):
+            self.shape = tuple(self.image.shape)
+        else:
+            self.shape = self.data.shape
         self.orient = nib.aff2axcodes(self.affine)
 
+    @property
+    def data(self):
+        """
+        ndarray: Full image data, read from the proxy on first access.
+
+        np.asanyarray keeps the on-disk dtype (get_fdata would promote
+        everything to float64), so an int16 anatomical costs a quarter of
+        the memory it used to.
+        """
+        if self._data is None:
+            if self._dataobj is not None:
+                self._data = np.asanyarray(self._dataobj)
+            else:
+                self._data = self.image.get_fdata()
+        return self._data
+
     def get_affine(self):
         """
         Get the affine transformation matrix.
@@ -111,4 +136,9 @@ class NiftiFile:
         """
         if not self.is_4d():
             raise ValueError("NIfTI file is not 4D")
+        if self._data is None and self._dataobj is not None:
+            # Slicing the proxy reads only the requested frame from disk
+            # (an O(frame) read on memory-mapped .nii); gzip payloads are
+            # decompressed up to the frame but still never fully resident.
+            return np.asanyarray(self._dataobj[..., t])
         return self.data[..., t]
\ No newline at end of file
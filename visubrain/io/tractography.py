@@ -83,13 +83,77 @@ class Tractography:
         """
         return self.streamlines
 
-    def get_color_points(self, show_points: bool, streamlines):
+    def _flat_color_points(self, show_points, streamlines,
+                           flat_points=None, lengths=None):
+        """
+        Color and connect all streamline points over one concatenated buffer.
+
+        Args:
+            show_points (bool): If True, skip building line connectivity.
+            streamlines: Points coordinates to be color associated.
+            flat_points (optional): Concatenated points of all streamlines.
+            lengths (optional): Point count per streamline, required together
+                with flat_points.
+
+        Returns:
+            tuple: (flat_points, flat_colors, cells, counts, starts, ends,
+            cell_starts); cells and cell_starts are None when show_points is
+            True.
+        """
+        if flat_points is not None:
+            counts = np.asarray(lengths, dtype=np.int64)
+        else:
+            streamlines = [np.asarray(s) for s in streamlines]
+            counts = np.array([s.shape[0] for s in streamlines], dtype=np.int64)
+        total = int(counts.sum())
+        if total == 0:
+            return None, None, None, counts, None, None, None
+
+        ends = np.cumsum(counts)
+        starts = ends - counts
+
+        # Tangents for every point in one pass over the concatenated points:
+        # diffs crossing from one streamline to the next are replaced by the
+        # last internal diff of the streamline (repeat-last behaviour), and
+        # sub-2-point streamlines are painted white afterwards.
+        if flat_points is None:
+            flat_points = np.concatenate(streamlines)
+        diffs = np.zeros_like(flat_points, dtype=np.float64)
+        diffs[:-1] = np.diff(flat_points, axis=0)
+        diffs[ends - 1] = diffs[ends - 2]
+        norms = np.linalg.norm(diffs, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        flat_colors = (np.abs(diffs / norms) * 255).astype(np.uint8)
+        flat_colors[starts[counts < 2]] = 255
+
+        cells = None
+        cell_starts = None
+        if not show_points:
+            # One preallocated [n_points, idx0, ..., idxN] cell block.
+            cells = np.empty(total + len(counts), dtype=np.int64)
+            cell_starts = starts + np.arange(len(counts))
+            cells[cell_starts] = counts
+            point_ids = np.arange(total + len(counts))
+            mask = np.ones(total + len(counts), dtype=bool)
+            mask[cell_starts] = False
+            cells[mask] = point_ids[mask] - np.repeat(np.arange(1, len(counts) + 1),
+                                                      counts)
+
+        return flat_points, flat_colors, cells, counts, starts, ends, cell_starts
+
+    def get_color_points(self, show_points: bool, streamlines,
+                         flat_points=None, lengths=None):
         """
         Compute color mapping for each streamline point, using local tangent.
 
         Args:
             show_points (bool): If True, display as points (for 3D viewer). (not used here)
             streamlines : Points coordinates to be color associated
+            flat_points (optional): Concatenated points of all streamlines;
+                callers that already hold the flat buffer (e.g. after a batch
+                transform) can pass it to skip re-concatenating here.
+            lengths (optional): Point count per streamline, required together
+                with flat_points.
 
         Returns:
             tuple: (points_list, colors_list, connectivity)
@@ -99,33 +163,54 @@ class Tractography:
             - Green = Y axis
             - Blue = Z axis
         """
-        points_list = []
-        colors_list = []
-        connectivity = []  # for line display
-        offset = 0
+        flat_points, flat_colors, cells, counts, starts, ends, cell_starts = \
+            self._flat_color_points(show_points, streamlines, flat_points, lengths)
+        if flat_points is None:
+            return [], [], []
 
-        for streamline in streamlines:
-            streamline = np.asarray(streamline)
-            n_points = streamline.shape[0]
+        points_list = [flat_points[s:e] for s, e in zip(starts, ends)]
+        colors_list = [flat_colors[s:e] for s, e in zip(starts, ends)]
 
-            if n_points < 2:
-                colors = np.tile(np.array([255, 255, 255], dtype=np.uint8), (n_points, 1))
-            else:
-                diffs = np.diff(streamline, axis=0) # compute tangent for each point
-                diffs = np.vstack([diffs, diffs[-1]]) # repeat last to keep size
-                norms = np.linalg.norm(diffs, axis=1, keepdims=True)
-                norms[norms == 0] = 1.0
-                tangents = diffs / norms
-                colors = (np.abs(tangents) * 255).astype(np.uint8)
+        connectivity = []  # for line display
+        if cells is not None:
+            connectivity = [cells[cs:cs + 1 + n] for cs, n in zip(cell_starts, counts)]
 
-            points_list.append(streamline)
-            colors_list.append(colors)
+        return points_list, colors_list, connectivity
 
-            # build connectivity for this streamline (for lines display)
-            if not show_points:
-                cell = np.hstack(([n_points], np.arange(offset, offset + n_points)))
-                connectivity.append(cell)
+    def get_color_points_concat(self, show_points: bool, streamlines=None):
+        """
+        Concatenated variant of get_color_points for display pipelines.
 
-            offset += n_points
+        Returns the flat buffers directly instead of per-streamline views, so
+        callers building one PolyData out of the whole tractogram skip the
+        vstack/hstack re-concatenation of millions of rows. Connectivity is
+        expressed as a VTK-style offsets vector (cumulative point counts):
+        since the points are concatenated in streamline order, the point ids
+        themselves are simply 0..N-1 and need no explicit array here.
 
-        return points_list, colors_list, connectivity
\ No newline at end of file
+        Args:
+            show_points (bool): If True, skip building line connectivity.
+            streamlines (optional): Streamlines to process; defaults to the
+                loaded streamlines.
+
+        Returns:
+            tuple: (points (N, 3), colors (N, 3) uint8, offsets int64 vector
+            of length n_streamlines + 1, empty when show_points is True).
+        """
+        if streamlines is None:
+            streamlines = self.streamlines
+        flat_points, flat_colors, _, counts, _, _, _ = \
+            self._flat_color_points(True, streamlines)
+        if flat_points is None:
+            empty = np.empty((0, 3))
+            return empty, empty.astype(np.uint8), np.empty(0, dtype=np.int64)
+        if show_points:
+            offsets = np.empty(0, dtype=np.int64)
+        else:
+            offsets = np.empty(len(counts) + 1, dtype=np.int64)
+            offsets[0] = 0
+            np.cumsum(counts, out=offsets[1:])
+        # Rendering never needs float64 coordinates; float32 halves the
+        # buffer VTK uploads (the tangent colors above are already computed
+        # before this narrowing).
+        return flat_points.astype(np.float32, copy=False), flat_colors, offsets
\ No newline at end of file
@@ -42,7 +42,16 @@ class VMRFile:
         """
         nii = nib.load(nifti_path)
         nii_ras = nib.as_closest_canonical(nii)
-        nii_ras_data = np.nan_to_num(nii_ras.get_fdata(), nan=0.)
+        # Read the payload in its on-disk dtype: integer volumes stay integer
+        # (enabling the exact histogram percentiles below) instead of being
+        # promoted to float64 by get_fdata.
+        data_proxy = getattr(nii_ras, "dataobj", None)
+        if data_proxy is not None:
+            nii_ras_data = np.asanyarray(data_proxy)
+        else:
+            nii_ras_data = nii_ras.get_fdata()
+        if nii_ras_data.dtype.kind == 'f':
+            nii_ras_data = np.nan_to_num(nii_ras_data, nan=0.)
 
         row_dir, col_dir, slice_1_center, slice_n_center = self._get_pos_from_nifti(nii_ras)
 
@@ -51,13 +60,12 @@ class VMRFile:
         slice_1_center_x, slice_1_center_y, slice_1_center_z = slice_1_center
         slice_n_center_x, slice_n_center_y, slice_n_center_z = slice_n_center
 
-        v16_data = np.copy(nii_ras_data)
-        thr_min, thr_max = np.percentile(v16_data[v16_data != 0], [0, 100])
-        v16_data[v16_data > thr_max] = thr_max
-        v16_data[v16_data < thr_min] = thr_min
-        v16_data = v16_data - thr_min
-        v16_data = v16_data / (thr_max - thr_min) * 65535
-        v16_data = np.asarray(v16_data, dtype=np.ushort)
+        # The nonzero gather is shared by both normalization passes, and the
+        # v16 thresholds (0th/100th percentile) are plain min/max reductions
+        # rather than a percentile sort.
+        nonzero = nii_ras_data[nii_ras_data != 0]
+        v16_data = self._normalize(nii_ras_data, nonzero.min(), nonzero.max(),
+                                   65535, np.ushort)
 
         dims = nii_ras_data.shape
         voxdims = [nii_ras.header["pixdim"][1],
@@ -67,13 +75,9 @@ class VMRFile:
         vmr_header, vmr_data = create_vmr()
 
         # Update VMR data (type cast nifti data to uint8 after range normalization)
-        vmr_data = np.copy(nii_ras_data)
-        thr_min, thr_max = np.percentile(vmr_data[vmr_data != 0], [1, 99])
-        vmr_data[vmr_data > thr_max] = thr_max
-        vmr_data[vmr_data < thr_min] = thr_min
-        vmr_data = vmr_data - thr_min
-        vmr_data = vmr_data / (thr_max - thr_min) * 225  # Special BV range
-        vmr_data = np.asarray(vmr_data, dtype=np.ubyte)
+        thr_min, thr_max = self._percentile_1_99(nonzero)
+        vmr_data = self._normalize(nii_ras_data, thr_min, thr_max,
+                                   225, np.ubyte)  # Special BV range
 
         # Update VMR headers
         vmr_header["ColDirX"] = col_dir_x
@@ -118,6 +122,61 @@ class VMRFile:
 
         write_vmr(output, vmr_header, vmr_data)
 
+    @staticmethod
+    def _percentile_1_99(nonzero):
+        """
+        Compute the 1st/99th percentile thresholds of the nonzero voxels.
+
+        Integer volumes with a bounded value range go through a bincount
+        histogram: one O(N) pass and a cumulative-sum lookup give exact
+        percentiles without sorting the whole array. Float volumes (or
+        pathological integer ranges) fall back to np.percentile on a strided
+        sample when the array is very large.
+
+        Args:
+            nonzero: 1D array of nonzero voxel intensities.
+
+        Returns:
+            tuple: (thr_min, thr_max) threshold values.
+        """
+        if nonzero.dtype.kind in 'iu':
+            offset = int(nonzero.min())
+            if int(nonzero.max()) - offset < 65536:
+                hist = np.bincount(nonzero.astype(np.int64, copy=False) - offset)
+                cum = np.cumsum(hist)
+                total = cum[-1]
+                thr_min = int(np.searchsorted(cum, total * 0.01)) + offset
+                thr_max = int(np.searchsorted(cum, total * 0.99)) + offset
+                return float(thr_min), float(thr_max)
+        sample = nonzero[::16] if nonzero.size > 10_000_000 else nonzero
+        thr_min, thr_max = np.percentile(sample, [1, 99])
+        return thr_min, thr_max
+
+    @staticmethod
+    def _normalize(data, thr_min, thr_max, scale, dtype):
+        """
+        Normalize a volume into [0, scale] and cast it to the target dtype.
+
+        The whole pass runs through one float32 working buffer with in-place
+        subtract/multiply/clip, instead of chaining full-volume float64
+        temporaries for the threshold masks and arithmetic.
+
+        Args:
+            data: Input volume.
+            thr_min (float): Lower intensity threshold.
+            thr_max (float): Upper intensity threshold.
+            scale (int): Upper bound of the output range.
+            dtype: Output integer dtype.
+
+        Returns:
+            numpy.ndarray: Normalized volume in the requested dtype.
+        """
+        out = np.empty(data.shape, dtype=np.float32)
+        np.subtract(data, thr_min, out=out, dtype=np.float32)
+        np.multiply(out, scale / (thr_max - thr_min), out=out)
+        np.clip(out, 0, scale, out=out)
+        return out.astype(dtype, copy=False)
+
     @staticmethod
     def _get_pos_from_nifti(nii):
         """
@@ -106,15 +106,21 @@ class Session:
         for name, tracto_obj in self.tracts.items():
             slines = tracto_obj.get_streamlines()
             n_streams = len(slines)
-            lengths = []
-            for sl in slines:
-                pts = np.asarray(sl)
-                if pts.shape[0] < 2:
-                    continue
-                diffs = np.diff(pts, axis=0)
-                lengths.append(np.linalg.norm(diffs, axis=1).sum())
-            mean_len = np.mean(lengths) if lengths else 0.0
-            total_len = np.sum(lengths)
+            valid = [np.asarray(sl) for sl in slines if np.asarray(sl).shape[0] >= 2]
+            if valid:
+                # One concatenated diff/norm pass over every streamline, then
+                # per-streamline sums via reduceat. Diffs that straddle two
+                # consecutive streamlines are zeroed so they do not leak into
+                # either sum.
+                starts = np.concatenate(([0], np.cumsum([len(s) for s in valid])[:-1]))
+                segments = np.linalg.norm(np.diff(np.concatenate(valid), axis=0), axis=1)
+                segments[starts[1:] - 1] = 0.0
+                lengths = np.add.reduceat(segments, starts)
+                mean_len = lengths.mean()
+                total_len = lengths.sum()
+            else:
+                mean_len = 0.0
+                total_len = 0.0
             report_lines.append(
                 f"{Path(name).name}\n"
                 f"  • Number of streamlines: {n_streams}\n"
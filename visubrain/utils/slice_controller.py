@@ -53,12 +53,16 @@ class SliceControl:
         """
         Update the slider value when the line edit value is changed by the user.
         """
-        try:
-            value = int(self.line_edit.text())
-            if 0 <= value <= self.slider.maximum():
-                self.slider.setValue(value)
-        except ValueError:
-            pass
+        text = self.line_edit.text().strip()
+        # Slice indices are plain non-negative integers: checking isdecimal()
+        # first avoids raising/catching ValueError on every invalid entry.
+        # isdecimal (unlike isdigit) accepts exactly the characters int()
+        # parses, so superscript/circled digits are rejected here too.
+        if not text.isdecimal():
+            return
+        value = int(text)
+        if value <= self.slider.maximum():
+            self.slider.setValue(value)
 
     def set_max(self, max_val: int):
         """